@@ -161,6 +161,12 @@ body {
   overflow-x: auto;
 }
 
+/* Task-table reorders and paging stay inside the panel's layout; containment
+   on the tbody itself is ignored for internal table boxes. */
+#tab-dashboard .panel {
+  contain: layout style;
+}
+
 table {
   width: 100%;
   border-collapse: collapse;
@@ -8,12 +8,11 @@ Imported by tusk-dashboard.py via importlib (hyphenated filename requires it).
 """
 
 import logging
-import os
 import sqlite3
 import sys
-
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-import tusk_loader
+from collections import defaultdict
+from datetime import date, timedelta
+from pathlib import Path
 
 log = logging.getLogger(__name__)
 
@@ -22,8 +21,123 @@ log = logging.getLogger(__name__)
 # Database helpers
 # ---------------------------------------------------------------------------
 
-_db_lib = tusk_loader.load("tusk-db-lib")
-get_connection = _db_lib.get_connection
+# Read-side tuning for the dashboard's one-shot aggregate queries. Journal
+# mode (WAL, set by `tusk init`) and synchronous only matter to writers, so
+# they are left alone; query_only guards against accidental writes.
+_READ_PRAGMAS = """
+PRAGMA query_only = 1;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -65536;
+PRAGMA mmap_size = 268435456;
+"""
+
+
+def get_connection(db_path: str) -> sqlite3.Connection:
+    """Return a read-only connection tuned for dashboard queries.
+
+    Unlike tusk-db-lib's get_connection, the file is opened with mode=ro in
+    autocommit mode: the dashboard never writes, so it needs no write access
+    and does not checkpoint the WAL on close. Rows use sqlite3.Row as there.
+    """
+    uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(_READ_PRAGMAS)
+    return conn
+
+
+def _dict_rows(cur: sqlite3.Cursor) -> list[dict]:
+    """Drain *cur* into plain dicts keyed by column name.
+
+    Fetches raw tuples and zips them against the column names read once from
+    cursor.description, which avoids building an sqlite3.Row per row and then
+    resolving every column by name again in dict(row).
+    """
+    cur.row_factory = None
+    names = [d[0] for d in cur.description]
+    return [dict(zip(names, r)) for r in cur.fetchall()]
+
+
+def _intern_columns(rows: list[dict], columns: tuple[str, ...]) -> None:
+    """Intern low-cardinality string columns in place.
+
+    sqlite3 returns a fresh str per row, so thousands of tasks would otherwise
+    each carry their own copy of "Done" or "feature"; interned, every row
+    shares one object and equality checks short-circuit on identity.
+    """
+    intern = sys.intern
+    for row in rows:
+        for col in columns:
+            value = row[col]
+            if value is not None:
+                row[col] = intern(value)
+
+
+def _offset_modifier(offset_minutes: int) -> str:
+    """Return the SQLite date modifier (e.g. '+330 minutes') bound as :offset."""
+    sign = "+" if offset_minutes >= 0 else ""
+    return f"{sign}{offset_minutes} minutes"
+
+
+_HAS_TASKS_SQL = "SELECT EXISTS (SELECT 1 FROM tasks)"
+
+
+def fetch_has_tasks(conn: sqlite3.Connection) -> bool:
+    """Return whether the project has any tasks (stops at the first row)."""
+    return bool(conn.execute(_HAS_TASKS_SQL).fetchone()[0])
+
+
+_TASK_METRICS_SQL = """
+SELECT tm.id, tm.summary, tm.status,
+       tm.session_count,
+       COALESCE(tm.total_tokens_in, 0) as total_tokens_in,
+       COALESCE(tm.total_tokens_out, 0) as total_tokens_out,
+       COALESCE(tm.total_cost, 0) as total_cost,
+       tm.complexity,
+       tm.priority_score,
+       tm.domain,
+       tm.task_type,
+       COALESCE(tm.total_duration_seconds, 0) as total_duration_seconds,
+       COALESCE(tm.total_lines_added, 0) as total_lines_added,
+       COALESCE(tm.total_lines_removed, 0) as total_lines_removed,
+       tm.updated_at,
+       (SELECT GROUP_CONCAT(model)
+        FROM (SELECT model, MAX(started_at) as last_used
+              FROM task_sessions s2
+              WHERE s2.task_id = tm.id AND s2.model IS NOT NULL
+              GROUP BY model
+              ORDER BY last_used DESC)) as models,
+       (SELECT ROUND(MIN(s4.first_context_tokens) * 100.0 / COALESCE(s4.context_window, 200000), 1)
+        FROM task_sessions s4
+        WHERE s4.task_id = tm.id AND s4.first_context_tokens IS NOT NULL) as first_ctx_pct,
+       (SELECT ROUND(MAX(s5.peak_context_tokens) * 100.0 / COALESCE(s5.context_window, 200000), 1)
+        FROM task_sessions s5
+        WHERE s5.task_id = tm.id AND s5.peak_context_tokens IS NOT NULL) as peak_ctx_pct,
+       (SELECT ROUND(MAX(s6.last_context_tokens) * 100.0 / COALESCE(s6.context_window, 200000), 1)
+        FROM task_sessions s6
+        WHERE s6.task_id = tm.id AND s6.last_context_tokens IS NOT NULL) as last_ctx_pct,
+       CASE
+         WHEN tm.status = 'In Progress' THEN
+           CAST((julianday('now') - julianday(COALESCE(
+             (SELECT MIN(s3.started_at) FROM task_sessions s3 WHERE s3.task_id = tm.id),
+             tm.started_at,
+             tm.created_at
+           ))) * 86400 AS INTEGER)
+         WHEN tm.status = 'To Do' THEN
+           CAST((julianday('now') - julianday(tm.created_at)) * 86400 AS INTEGER)
+         ELSE
+           CAST((julianday(COALESCE(
+             (SELECT MAX(s3.ended_at) FROM task_sessions s3 WHERE s3.task_id = tm.id),
+             tm.updated_at
+           )) - julianday(COALESCE(
+             (SELECT MIN(s3.started_at) FROM task_sessions s3 WHERE s3.task_id = tm.id),
+             tm.started_at,
+             tm.created_at
+           ))) * 86400 AS INTEGER)
+       END as duration_in_status_seconds
+FROM task_metrics tm
+ORDER BY tm.total_cost DESC, tm.id ASC
+"""
 
 
 def fetch_task_metrics(conn: sqlite3.Connection) -> list[dict]:
@@ -32,80 +146,31 @@ def fetch_task_metrics(conn: sqlite3.Connection) -> list[dict]:
     Includes domain, duration, and lines changed alongside token/cost data.
     """
     log.debug("Querying task_metrics view")
-    rows = conn.execute(
-        """SELECT tm.id, tm.summary, tm.status,
-                  tm.session_count,
-                  COALESCE(tm.total_tokens_in, 0) as total_tokens_in,
-                  COALESCE(tm.total_tokens_out, 0) as total_tokens_out,
-                  COALESCE(tm.total_cost, 0) as total_cost,
-                  tm.complexity,
-                  tm.priority_score,
-                  tm.domain,
-                  tm.task_type,
-                  COALESCE(tm.total_duration_seconds, 0) as total_duration_seconds,
-                  COALESCE(tm.total_lines_added, 0) as total_lines_added,
-                  COALESCE(tm.total_lines_removed, 0) as total_lines_removed,
-                  tm.updated_at,
-                  (SELECT GROUP_CONCAT(model)
-                   FROM (SELECT model, MAX(started_at) as last_used
-                         FROM task_sessions s2
-                         WHERE s2.task_id = tm.id AND s2.model IS NOT NULL
-                         GROUP BY model
-                         ORDER BY last_used DESC)) as models,
-                  (SELECT ROUND(MIN(s4.first_context_tokens) * 100.0 / COALESCE(s4.context_window, 200000), 1)
-                   FROM task_sessions s4
-                   WHERE s4.task_id = tm.id AND s4.first_context_tokens IS NOT NULL) as first_ctx_pct,
-                  (SELECT ROUND(MAX(s5.peak_context_tokens) * 100.0 / COALESCE(s5.context_window, 200000), 1)
-                   FROM task_sessions s5
-                   WHERE s5.task_id = tm.id AND s5.peak_context_tokens IS NOT NULL) as peak_ctx_pct,
-                  (SELECT ROUND(MAX(s6.last_context_tokens) * 100.0 / COALESCE(s6.context_window, 200000), 1)
-                   FROM task_sessions s6
-                   WHERE s6.task_id = tm.id AND s6.last_context_tokens IS NOT NULL) as last_ctx_pct,
-                  CASE
-                    WHEN tm.status = 'In Progress' THEN
-                      CAST((julianday('now') - julianday(COALESCE(
-                        (SELECT MIN(s3.started_at) FROM task_sessions s3 WHERE s3.task_id = tm.id),
-                        tm.started_at,
-                        tm.created_at
-                      ))) * 86400 AS INTEGER)
-                    WHEN tm.status = 'To Do' THEN
-                      CAST((julianday('now') - julianday(tm.created_at)) * 86400 AS INTEGER)
-                    ELSE
-                      CAST((julianday(COALESCE(
-                        (SELECT MAX(s3.ended_at) FROM task_sessions s3 WHERE s3.task_id = tm.id),
-                        tm.updated_at
-                      )) - julianday(COALESCE(
-                        (SELECT MIN(s3.started_at) FROM task_sessions s3 WHERE s3.task_id = tm.id),
-                        tm.started_at,
-                        tm.created_at
-                      ))) * 86400 AS INTEGER)
-                  END as duration_in_status_seconds
-           FROM task_metrics tm
-           ORDER BY tm.total_cost DESC, tm.id ASC"""
-    ).fetchall()
-    result = [dict(r) for r in rows]
+    cur = conn.execute(_TASK_METRICS_SQL)
+    result = _dict_rows(cur)
+    _intern_columns(result, ("status", "complexity", "task_type", "domain"))
     log.debug("Fetched %d task metrics rows", len(result))
     return result
 
 
+_KPI_SQL = """
+SELECT s.total_cost, s.total_tokens_in, s.total_tokens_out,
+       t.tasks_completed, t.tasks_total
+FROM (SELECT COALESCE(SUM(cost_dollars), 0) as total_cost,
+             COALESCE(SUM(tokens_in), 0) as total_tokens_in,
+             COALESCE(SUM(tokens_out), 0) as total_tokens_out
+      FROM task_sessions) s,
+     (SELECT COALESCE(SUM(CASE WHEN status = 'Done' THEN 1 ELSE 0 END), 0) as tasks_completed,
+             COUNT(*) as tasks_total
+      FROM tasks) t
+"""
+
+
 def fetch_kpi_data(conn: sqlite3.Connection) -> dict:
     """Fetch aggregated totals for KPI summary cards."""
     log.debug("Querying KPI data")
-    row = conn.execute(
-        """SELECT
-               COALESCE(SUM(s.cost_dollars), 0) as total_cost,
-               COALESCE(SUM(s.tokens_in), 0) as total_tokens_in,
-               COALESCE(SUM(s.tokens_out), 0) as total_tokens_out
-           FROM task_sessions s"""
-    ).fetchone()
-
-    tasks_completed = conn.execute(
-        "SELECT COUNT(*) as count FROM tasks WHERE status = 'Done'"
-    ).fetchone()["count"]
-
-    tasks_total = conn.execute(
-        "SELECT COUNT(*) as count FROM tasks"
-    ).fetchone()["count"]
+    row = conn.execute(_KPI_SQL).fetchone()
+    tasks_completed = row["tasks_completed"]
 
     result = {
         "total_cost": row["total_cost"],
@@ -113,79 +178,81 @@ def fetch_kpi_data(conn: sqlite3.Connection) -> dict:
         "total_tokens_out": row["total_tokens_out"],
         "total_tokens": row["total_tokens_in"] + row["total_tokens_out"],
         "tasks_completed": tasks_completed,
-        "tasks_total": tasks_total,
+        "tasks_total": row["tasks_total"],
         "avg_cost_per_task": row["total_cost"] / tasks_completed if tasks_completed > 0 else 0,
     }
     log.debug("KPI data: %s", result)
     return result
 
 
+_ALL_CRITERIA_SQL = """
+SELECT id, task_id, criterion, is_completed, source, cost_dollars, tokens_in, tokens_out, completed_at, criterion_type, commit_hash, committed_at
+FROM acceptance_criteria
+ORDER BY task_id, id
+"""
+
 
 def fetch_all_criteria(conn: sqlite3.Connection) -> dict[int, list[dict]]:
     """Fetch all acceptance criteria, grouped by task_id."""
     log.debug("Querying acceptance_criteria table")
-    rows = conn.execute(
-        """SELECT id, task_id, criterion, is_completed, source, cost_dollars, tokens_in, tokens_out, completed_at, criterion_type, commit_hash, committed_at
-           FROM acceptance_criteria
-           ORDER BY task_id, id"""
-    ).fetchall()
+    cur = conn.execute(_ALL_CRITERIA_SQL)
     result: dict[int, list[dict]] = {}
-    for r in rows:
-        d = dict(r)
-        tid = d["task_id"]
-        result.setdefault(tid, []).append(d)
+    for d in _dict_rows(cur):
+        result.setdefault(d["task_id"], []).append(d)
     log.debug("Fetched criteria for %d tasks", len(result))
     return result
 
 
+_TASK_DEPENDENCIES_SQL = """
+SELECT task_id, depends_on_id, relationship_type
+FROM task_dependencies
+"""
+
+
 def fetch_task_dependencies(conn: sqlite3.Connection) -> dict[int, dict]:
     """Fetch task dependencies, indexed by task_id with blocked_by and blocks lists."""
     log.debug("Querying task_dependencies table")
-    rows = conn.execute(
-        """SELECT task_id, depends_on_id, relationship_type
-           FROM task_dependencies"""
-    ).fetchall()
-    result: dict[int, dict] = {}
-    for r in rows:
-        tid = r["task_id"]
-        dep_id = r["depends_on_id"]
-        rel = r["relationship_type"]
-        result.setdefault(tid, {"blocked_by": [], "blocks": []})
+    cur = conn.execute(_TASK_DEPENDENCIES_SQL)
+    cur.row_factory = None
+    result: defaultdict[int, dict] = defaultdict(lambda: {"blocked_by": [], "blocks": []})
+    for tid, dep_id, rel in cur.fetchall():
         result[tid]["blocked_by"].append({"id": dep_id, "type": rel})
-        result.setdefault(dep_id, {"blocked_by": [], "blocks": []})
         result[dep_id]["blocks"].append({"id": tid, "type": rel})
     log.debug("Fetched dependencies for %d tasks", len(result))
-    return result
+    return dict(result)
 
 
 # ---------------------------------------------------------------------------
 # DAG-specific data fetching
 # ---------------------------------------------------------------------------
 
+_DAG_TASKS_SQL = """
+SELECT tm.id, tm.summary, tm.status, tm.priority, tm.domain,
+       tm.task_type, tm.complexity, tm.priority_score,
+       COALESCE(tm.session_count, 0) as session_count,
+       COALESCE(tm.total_tokens_in, 0) as total_tokens_in,
+       COALESCE(tm.total_tokens_out, 0) as total_tokens_out,
+       COALESCE(tm.total_cost, 0) as total_cost,
+       COALESCE(tm.total_duration_seconds, 0) as total_duration_seconds,
+       COALESCE(ac.criteria_total, 0) as criteria_total,
+       COALESCE(ac.criteria_done, 0) as criteria_done
+FROM task_metrics tm
+LEFT JOIN (
+    SELECT task_id,
+           COUNT(*) as criteria_total,
+           SUM(is_completed) as criteria_done
+    FROM acceptance_criteria
+    GROUP BY task_id
+) ac ON ac.task_id = tm.id
+ORDER BY tm.id ASC
+"""
+
+
 def fetch_dag_tasks(conn: sqlite3.Connection) -> list[dict]:
     """Fetch all tasks with metrics and criteria counts for DAG rendering."""
     log.debug("Querying task_metrics view with criteria counts for DAG")
-    rows = conn.execute(
-        """SELECT tm.id, tm.summary, tm.status, tm.priority, tm.domain,
-                  tm.task_type, tm.complexity, tm.priority_score,
-                  COALESCE(tm.session_count, 0) as session_count,
-                  COALESCE(tm.total_tokens_in, 0) as total_tokens_in,
-                  COALESCE(tm.total_tokens_out, 0) as total_tokens_out,
-                  COALESCE(tm.total_cost, 0) as total_cost,
-                  COALESCE(tm.total_duration_seconds, 0) as total_duration_seconds,
-                  COALESCE(ac.criteria_total, 0) as criteria_total,
-                  COALESCE(ac.criteria_done, 0) as criteria_done
-           FROM task_metrics tm
-           LEFT JOIN (
-               SELECT task_id,
-                      COUNT(*) as criteria_total,
-                      SUM(is_completed) as criteria_done
-               FROM acceptance_criteria
-               GROUP BY task_id
-           ) ac ON ac.task_id = tm.id
-           ORDER BY tm.id ASC"""
-    ).fetchall()
-    result = [dict(r) for r in rows]
+    cur = conn.execute(_DAG_TASKS_SQL)
+    result = _dict_rows(cur)
     log.debug("Fetched %d DAG tasks", len(result))
     return result
 
@@ -193,27 +260,34 @@ def fetch_dag_tasks(conn: sqlite3.Connection) -> list[dict]:
 def fetch_edges(conn: sqlite3.Connection) -> list[dict]:
     """Fetch all dependency edges for DAG."""
     log.debug("Querying task_dependencies for DAG")
-    rows = conn.execute(
-        """SELECT task_id, depends_on_id, relationship_type
-           FROM task_dependencies"""
-    ).fetchall()
-    result = [dict(r) for r in rows]
+    cur = conn.execute(_TASK_DEPENDENCIES_SQL)
+    result = _dict_rows(cur)
     log.debug("Fetched %d edges", len(result))
     return result
 
 
+_BLOCKERS_SQL = """
+SELECT id, task_id, description, blocker_type, is_resolved
+FROM external_blockers
+"""
+
+
 def fetch_blockers(conn: sqlite3.Connection) -> list[dict]:
     """Fetch all external blockers for DAG."""
     log.debug("Querying external_blockers for DAG")
-    rows = conn.execute(
-        """SELECT id, task_id, description, blocker_type, is_resolved
-           FROM external_blockers"""
-    ).fetchall()
-    result = [dict(r) for r in rows]
+    cur = conn.execute(_BLOCKERS_SQL)
+    result = _dict_rows(cur)
     log.debug("Fetched %d blockers", len(result))
     return result
 
 
+_SKILL_RUNS_SQL = """
+SELECT id, skill_name, started_at, ended_at, cost_dollars, tokens_in, tokens_out, model, metadata
+FROM skill_runs
+ORDER BY started_at DESC
+"""
+
+
 def fetch_skill_runs(conn: sqlite3.Connection) -> list[dict]:
     """Fetch all skill runs sorted by most recent first.
 
@@ -221,19 +295,32 @@ def fetch_skill_runs(conn: sqlite3.Connection) -> list[dict]:
     """
     log.debug("Querying skill_runs table")
     try:
-        rows = conn.execute(
-            """SELECT id, skill_name, started_at, ended_at, cost_dollars, tokens_in, tokens_out, model, metadata
-               FROM skill_runs
-               ORDER BY started_at DESC"""
-        ).fetchall()
+        cur = conn.execute(_SKILL_RUNS_SQL)
     except sqlite3.OperationalError:
         log.warning("skill_runs table not found — run 'tusk migrate' to create it")
         return []
-    result = [dict(r) for r in rows]
+    result = _dict_rows(cur)
     log.debug("Fetched %d skill runs", len(result))
     return result
 
 
+_TOOL_CALL_STATS_PER_TASK_SQL = """
+SELECT tcs.task_id,
+       COALESCE(t.summary, '(Task ' || tcs.task_id || ')') as task_summary,
+       tcs.tool_name,
+       SUM(tcs.call_count) as call_count,
+       SUM(tcs.total_cost) as total_cost,
+       MAX(tcs.max_cost) as max_cost,
+       SUM(tcs.tokens_in) as tokens_in
+FROM tool_call_stats tcs
+LEFT JOIN tasks t ON tcs.task_id = t.id
+WHERE tcs.task_id IS NOT NULL
+  AND tcs.session_id IS NOT NULL
+GROUP BY tcs.task_id, tcs.tool_name
+ORDER BY tcs.task_id, total_cost DESC
+"""
+
+
 def fetch_tool_call_stats_per_task(conn: sqlite3.Connection) -> list[dict]:
     """Fetch per-task tool call aggregates (all tools per task).
 
@@ -241,29 +328,23 @@ def fetch_tool_call_stats_per_task(conn: sqlite3.Connection) -> list[dict]:
     """
     log.debug("Querying tool_call_stats for per-task aggregates")
     try:
-        rows = conn.execute(
-            """SELECT tcs.task_id,
-                      COALESCE(t.summary, '(Task ' || tcs.task_id || ')') as task_summary,
-                      tcs.tool_name,
-                      SUM(tcs.call_count) as call_count,
-                      SUM(tcs.total_cost) as total_cost,
-                      MAX(tcs.max_cost) as max_cost,
-                      SUM(tcs.tokens_in) as tokens_in
-               FROM tool_call_stats tcs
-               LEFT JOIN tasks t ON tcs.task_id = t.id
-               WHERE tcs.task_id IS NOT NULL
-                 AND tcs.session_id IS NOT NULL
-               GROUP BY tcs.task_id, tcs.tool_name
-               ORDER BY tcs.task_id, total_cost DESC"""
-        ).fetchall()
+        cur = conn.execute(_TOOL_CALL_STATS_PER_TASK_SQL)
     except sqlite3.OperationalError:
         log.warning("tool_call_stats table not found — run 'tusk migrate' to create it")
         return []
-    result = [dict(r) for r in rows]
+    result = _dict_rows(cur)
     log.debug("Fetched %d per-task tool call stat rows", len(result))
     return result
 
 
+_TOOL_CALL_STATS_PER_SKILL_RUN_SQL = """
+SELECT skill_run_id, tool_name, call_count, total_cost, max_cost, tokens_in
+FROM tool_call_stats
+WHERE skill_run_id IS NOT NULL
+ORDER BY skill_run_id, total_cost DESC
+"""
+
+
 def fetch_tool_call_stats_per_skill_run(conn: sqlite3.Connection) -> list[dict]:
     """Fetch per-skill-run tool call rows.
 
@@ -272,20 +353,23 @@ def fetch_tool_call_stats_per_skill_run(conn: sqlite3.Connection) -> list[dict]:
     """
     log.debug("Querying tool_call_stats for per-skill-run aggregates")
     try:
-        rows = conn.execute(
-            """SELECT skill_run_id, tool_name, call_count, total_cost, max_cost, tokens_in
-               FROM tool_call_stats
-               WHERE skill_run_id IS NOT NULL
-               ORDER BY skill_run_id, total_cost DESC"""
-        ).fetchall()
+        cur = conn.execute(_TOOL_CALL_STATS_PER_SKILL_RUN_SQL)
     except sqlite3.OperationalError:
         log.warning("tool_call_stats skill_run_id column not found — run 'tusk migrate' to update schema")
         return []
-    result = [dict(r) for r in rows]
+    result = _dict_rows(cur)
     log.debug("Fetched %d per-skill-run tool call stat rows", len(result))
     return result
 
 
+_TOOL_CALL_STATS_PER_CRITERION_SQL = """
+SELECT criterion_id, tool_name, call_count, total_cost, max_cost, tokens_in
+FROM tool_call_stats
+WHERE criterion_id IS NOT NULL
+ORDER BY criterion_id, total_cost DESC
+"""
+
+
 def fetch_tool_call_stats_per_criterion(conn: sqlite3.Connection) -> list[dict]:
     """Fetch per-criterion tool call rows.
 
@@ -293,20 +377,24 @@ def fetch_tool_call_stats_per_criterion(conn: sqlite3.Connection) -> list[dict]:
     """
     log.debug("Querying tool_call_stats for per-criterion aggregates")
     try:
-        rows = conn.execute(
-            """SELECT criterion_id, tool_name, call_count, total_cost, max_cost, tokens_in
-               FROM tool_call_stats
-               WHERE criterion_id IS NOT NULL
-               ORDER BY criterion_id, total_cost DESC"""
-        ).fetchall()
+        cur = conn.execute(_TOOL_CALL_STATS_PER_CRITERION_SQL)
     except sqlite3.OperationalError:
         log.warning("tool_call_stats criterion_id column not found — run 'tusk migrate' to update schema")
         return []
-    result = [dict(r) for r in rows]
+    result = _dict_rows(cur)
     log.debug("Fetched %d per-criterion tool call stat rows", len(result))
     return result
 
 
+_TOOL_CALL_EVENTS_PER_CRITERION_SQL = """
+SELECT criterion_id, tool_name, cost_dollars, tokens_in, tokens_out,
+       call_sequence, called_at
+FROM tool_call_events
+WHERE criterion_id IS NOT NULL
+ORDER BY criterion_id, call_sequence
+"""
+
+
 def fetch_tool_call_events_per_criterion(conn: sqlite3.Connection) -> list[dict]:
     """Fetch per-criterion individual tool call event rows.
 
@@ -314,21 +402,27 @@ def fetch_tool_call_events_per_criterion(conn: sqlite3.Connection) -> list[dict]
     """
     log.debug("Querying tool_call_events for per-criterion events")
     try:
-        rows = conn.execute(
-            """SELECT criterion_id, tool_name, cost_dollars, tokens_in, tokens_out,
-                      call_sequence, called_at
-               FROM tool_call_events
-               WHERE criterion_id IS NOT NULL
-               ORDER BY criterion_id, call_sequence"""
-        ).fetchall()
+        cur = conn.execute(_TOOL_CALL_EVENTS_PER_CRITERION_SQL)
     except sqlite3.OperationalError:
         log.warning("tool_call_events table not found — run 'tusk migrate' to update schema")
         return []
-    result = [dict(r) for r in rows]
+    result = _dict_rows(cur)
     log.debug("Fetched %d per-criterion tool call event rows", len(result))
     return result
 
 
+_TOOL_CALL_STATS_GLOBAL_SQL = """
+SELECT tool_name,
+       SUM(call_count) as total_calls,
+       SUM(total_cost) as total_cost,
+       SUM(tokens_in) as tokens_in
+FROM tool_call_stats
+WHERE session_id IS NOT NULL
+GROUP BY tool_name
+ORDER BY total_cost DESC
+"""
+
+
 def fetch_tool_call_stats_global(conn: sqlite3.Connection) -> list[dict]:
     """Fetch project-wide tool call aggregates across all task sessions.
 
@@ -338,24 +432,33 @@ def fetch_tool_call_stats_global(conn: sqlite3.Connection) -> list[dict]:
     """
     log.debug("Querying tool_call_stats for project-wide aggregates")
     try:
-        rows = conn.execute(
-            """SELECT tool_name,
-                      SUM(call_count) as total_calls,
-                      SUM(total_cost) as total_cost,
-                      SUM(tokens_in) as tokens_in
-               FROM tool_call_stats
-               WHERE session_id IS NOT NULL
-               GROUP BY tool_name
-               ORDER BY total_cost DESC"""
-        ).fetchall()
+        cur = conn.execute(_TOOL_CALL_STATS_GLOBAL_SQL)
     except sqlite3.OperationalError:
         log.warning("tool_call_stats table not found — run 'tusk migrate' to create it")
         return []
-    result = [dict(r) for r in rows]
+    result = _dict_rows(cur)
     log.debug("Fetched %d global tool call stat rows", len(result))
     return result
 
 
+_HOURLY_TASK_COST_SQL = """
+SELECT CAST(strftime('%H', datetime(started_at, :offset)) AS INTEGER) as hour,
+       SUM(cost_dollars) as cost
+FROM task_sessions
+WHERE cost_dollars > 0
+GROUP BY hour
+"""
+
+
+_HOURLY_SKILL_COST_SQL = """
+SELECT CAST(strftime('%H', datetime(started_at, :offset)) AS INTEGER) as hour,
+       SUM(cost_dollars) as cost
+FROM skill_runs
+WHERE cost_dollars > 0
+GROUP BY hour
+"""
+
+
 def fetch_hourly_cost(conn: sqlite3.Connection, offset_minutes: int = 0) -> list[dict]:
     """Fetch total cost per local hour from task_sessions and skill_runs.
 
@@ -364,28 +467,15 @@ def fetch_hourly_cost(conn: sqlite3.Connection, offset_minutes: int = 0) -> list
     needs no column shift.
     """
     log.debug("Querying hourly cost data (offset_minutes=%d)", offset_minutes)
-    sign = "+" if offset_minutes >= 0 else ""
-    offset_mod = f"{sign}{offset_minutes} minutes"
+    offset_mod = _offset_modifier(offset_minutes)
     hour_map = {h: {"hour": h, "cost_tasks": 0.0, "cost_skills": 0.0} for h in range(24)}
 
-    task_rows = conn.execute(
-        f"""SELECT CAST(strftime('%H', datetime(started_at, '{offset_mod}')) AS INTEGER) as hour,
-                  SUM(COALESCE(cost_dollars, 0)) as cost
-           FROM task_sessions
-           WHERE cost_dollars > 0
-           GROUP BY hour"""
-    ).fetchall()
+    task_rows = conn.execute(_HOURLY_TASK_COST_SQL, {"offset": offset_mod}).fetchall()
     for r in task_rows:
         hour_map[r["hour"]]["cost_tasks"] = r["cost"]
 
     try:
-        skill_rows = conn.execute(
-            f"""SELECT CAST(strftime('%H', datetime(started_at, '{offset_mod}')) AS INTEGER) as hour,
-                      SUM(COALESCE(cost_dollars, 0)) as cost
-               FROM skill_runs
-               WHERE cost_dollars > 0
-               GROUP BY hour"""
-        ).fetchall()
+        skill_rows = conn.execute(_HOURLY_SKILL_COST_SQL, {"offset": offset_mod}).fetchall()
         for r in skill_rows:
             hour_map[r["hour"]]["cost_skills"] = r["cost"]
     except sqlite3.OperationalError:
@@ -396,6 +486,18 @@ def fetch_hourly_cost(conn: sqlite3.Connection, offset_minutes: int = 0) -> list
     return result
 
 
+_DOW_HOUR_HEATMAP_SQL = """
+SELECT CAST(strftime('%w', datetime(started_at, :offset)) AS INTEGER) as dow,
+       CAST(strftime('%H', datetime(started_at, :offset)) AS INTEGER) as hour,
+       SUM(cost_dollars) as cost,
+       COUNT(*) as session_count
+FROM task_sessions
+WHERE cost_dollars > 0
+GROUP BY dow, hour
+ORDER BY dow, hour
+"""
+
+
 def fetch_dow_hour_heatmap(conn: sqlite3.Connection, offset_minutes: int = 0) -> list[dict]:
     """Fetch day-of-week + hour cost heatmap from task_sessions (local-time buckets).
 
@@ -404,75 +506,72 @@ def fetch_dow_hour_heatmap(conn: sqlite3.Connection, offset_minutes: int = 0) ->
     done in SQL after applying offset_minutes so JS needs no column shift.
     """
     log.debug("Querying dow/hour heatmap data (offset_minutes=%d)", offset_minutes)
-    sign = "+" if offset_minutes >= 0 else ""
-    offset_mod = f"{sign}{offset_minutes} minutes"
-    rows = conn.execute(
-        f"""SELECT CAST(strftime('%w', datetime(started_at, '{offset_mod}')) AS INTEGER) as dow,
-                  CAST(strftime('%H', datetime(started_at, '{offset_mod}')) AS INTEGER) as hour,
-                  SUM(COALESCE(cost_dollars, 0)) as cost,
-                  COUNT(*) as session_count
-           FROM task_sessions
-           WHERE cost_dollars > 0
-           GROUP BY dow, hour
-           ORDER BY dow, hour"""
-    ).fetchall()
-    result = [dict(r) for r in rows]
+    offset_mod = _offset_modifier(offset_minutes)
+    cur = conn.execute(_DOW_HOUR_HEATMAP_SQL, {"offset": offset_mod})
+    result = _dict_rows(cur)
     log.debug("Fetched %d dow/hour heatmap cells", len(result))
     return result
 
 
-def fetch_cost_trend(conn: sqlite3.Connection, offset_minutes: int = 0) -> list[dict]:
-    """Fetch weekly cost aggregations from task_sessions, grouped by local date."""
-    log.debug("Querying cost trend data (offset_minutes=%d)", offset_minutes)
-    sign = "+" if offset_minutes >= 0 else ""
-    offset_mod = f"{sign}{offset_minutes} minutes"
-    rows = conn.execute(
-        f"""SELECT date(started_at, '{offset_mod}', 'weekday 0', '-6 days') as week_start,
-                  SUM(COALESCE(cost_dollars, 0)) as weekly_cost
-           FROM task_sessions
-           WHERE cost_dollars > 0
-           GROUP BY week_start
-           ORDER BY week_start"""
-    ).fetchall()
-    result = [dict(r) for r in rows]
-    log.debug("Fetched %d weekly cost buckets", len(result))
-    return result
+_COST_TREND_DAILY_SQL = """
+SELECT date(started_at, :offset) as day,
+       SUM(cost_dollars) as daily_cost
+FROM task_sessions
+WHERE cost_dollars > 0
+GROUP BY day
+ORDER BY day
+"""
 
 
 def fetch_cost_trend_daily(conn: sqlite3.Connection, offset_minutes: int = 0) -> list[dict]:
     """Fetch daily cost aggregations from task_sessions, grouped by local date."""
     log.debug("Querying daily cost trend data (offset_minutes=%d)", offset_minutes)
-    sign = "+" if offset_minutes >= 0 else ""
-    offset_mod = f"{sign}{offset_minutes} minutes"
-    rows = conn.execute(
-        f"""SELECT date(started_at, '{offset_mod}') as day,
-                  SUM(COALESCE(cost_dollars, 0)) as daily_cost
-           FROM task_sessions
-           WHERE cost_dollars > 0
-           GROUP BY day
-           ORDER BY day"""
-    ).fetchall()
-    result = [dict(r) for r in rows]
+    offset_mod = _offset_modifier(offset_minutes)
+    cur = conn.execute(_COST_TREND_DAILY_SQL, {"offset": offset_mod})
+    result = _dict_rows(cur)
     log.debug("Fetched %d daily cost buckets", len(result))
     return result
 
 
-def fetch_cost_trend_monthly(conn: sqlite3.Connection, offset_minutes: int = 0) -> list[dict]:
-    """Fetch monthly cost aggregations from task_sessions, grouped by local month."""
-    log.debug("Querying monthly cost trend data (offset_minutes=%d)", offset_minutes)
-    sign = "+" if offset_minutes >= 0 else ""
-    offset_mod = f"{sign}{offset_minutes} minutes"
-    rows = conn.execute(
-        f"""SELECT strftime('%Y-%m', started_at, '{offset_mod}') as month,
-                  SUM(COALESCE(cost_dollars, 0)) as monthly_cost
-           FROM task_sessions
-           WHERE cost_dollars > 0
-           GROUP BY month
-           ORDER BY month"""
-    ).fetchall()
-    result = [dict(r) for r in rows]
-    log.debug("Fetched %d monthly cost buckets", len(result))
-    return result
+def fetch_cost_trends(
+    conn: sqlite3.Connection, offset_minutes: int = 0
+) -> tuple[list[dict], list[dict], list[dict]]:
+    """Fetch daily, weekly and monthly cost trends with one scan of task_sessions.
+
+    Sessions are summed per local day in SQL; weeks (starting Monday) and
+    months are rolled up from the day buckets, which arrive in date order so
+    both roll-ups come out ordered too.
+
+    Returns (daily, weekly, monthly): daily rows are shaped like
+    fetch_cost_trend_daily's, weekly rows carry week_start/weekly_cost and
+    monthly rows month/monthly_cost.
+    """
+    daily = fetch_cost_trend_daily(conn, offset_minutes)
+    weekly_agg: dict[str, float] = {}
+    monthly_agg: dict[str, float] = {}
+    for r in daily:
+        day = r["day"]
+        cost = r["daily_cost"]
+        if day is None:
+            week = month = None
+        else:
+            d = date.fromisoformat(day)
+            week = (d - timedelta(days=d.weekday())).isoformat()
+            month = day[:7]
+        weekly_agg[week] = weekly_agg.get(week, 0) + cost
+        monthly_agg[month] = monthly_agg.get(month, 0) + cost
+    weekly = [{"week_start": k, "weekly_cost": v} for k, v in weekly_agg.items()]
+    monthly = [{"month": k, "monthly_cost": v} for k, v in monthly_agg.items()]
+    log.debug("Rolled up %d weekly and %d monthly cost buckets", len(weekly), len(monthly))
+    return daily, weekly, monthly
+
+
+_VELOCITY_SQL = """
+SELECT week, task_count, avg_cost
+FROM v_velocity
+ORDER BY week DESC
+LIMIT 8
+"""
 
 
 def fetch_velocity(conn: sqlite3.Connection) -> list[dict]:
@@ -484,50 +583,41 @@ def fetch_velocity(conn: sqlite3.Connection) -> list[dict]:
     """
     log.debug("Querying v_velocity view")
     try:
-        rows = conn.execute(
-            """SELECT week, task_count, avg_cost
-               FROM v_velocity
-               ORDER BY week DESC
-               LIMIT 8"""
-        ).fetchall()
+        cur = conn.execute(_VELOCITY_SQL)
     except sqlite3.OperationalError:
         log.warning("v_velocity view not found — run 'tusk migrate' to create it")
         return []
-    result = [dict(r) for r in rows]
+    result = _dict_rows(cur)
     result.reverse()  # oldest-first for display
     log.debug("Fetched %d velocity rows", len(result))
     return result
 
 
+_COMPLEXITY_METRICS_SQL = """
+SELECT t.complexity,
+       COUNT(DISTINCT t.id) as task_count,
+       ROUND(COUNT(s.id) * 1.0 / COUNT(DISTINCT t.id), 1) as avg_sessions,
+       ROUND(COALESCE(SUM(s.duration_seconds), 0) * 1.0 / COUNT(DISTINCT t.id)) as avg_duration_seconds,
+       ROUND(COALESCE(SUM(s.cost_dollars), 0) * 1.0 / COUNT(DISTINCT t.id), 2) as avg_cost
+FROM tasks t
+LEFT JOIN task_sessions s ON s.task_id = t.id
+WHERE t.status = 'Done' AND t.complexity IS NOT NULL
+GROUP BY t.complexity
+ORDER BY CASE t.complexity
+    WHEN 'XS' THEN 1
+    WHEN 'S' THEN 2
+    WHEN 'M' THEN 3
+    WHEN 'L' THEN 4
+    WHEN 'XL' THEN 5
+    ELSE 6
+END
+"""
+
+
 def fetch_complexity_metrics(conn: sqlite3.Connection) -> list[dict]:
     """Fetch average session count, duration, and cost grouped by complexity for completed tasks."""
     log.debug("Querying complexity metrics")
-    rows = conn.execute(
-        """SELECT t.complexity,
-                  COUNT(*) as task_count,
-                  ROUND(AVG(COALESCE(m.session_count, 0)), 1) as avg_sessions,
-                  ROUND(AVG(COALESCE(m.total_duration_seconds, 0))) as avg_duration_seconds,
-                  ROUND(AVG(COALESCE(m.total_cost, 0)), 2) as avg_cost
-           FROM tasks t
-           LEFT JOIN (
-               SELECT task_id,
-                      COUNT(id) as session_count,
-                      SUM(duration_seconds) as total_duration_seconds,
-                      SUM(cost_dollars) as total_cost
-               FROM task_sessions
-               GROUP BY task_id
-           ) m ON m.task_id = t.id
-           WHERE t.status = 'Done' AND t.complexity IS NOT NULL
-           GROUP BY t.complexity
-           ORDER BY CASE t.complexity
-               WHEN 'XS' THEN 1
-               WHEN 'S' THEN 2
-               WHEN 'M' THEN 3
-               WHEN 'L' THEN 4
-               WHEN 'XL' THEN 5
-               ELSE 6
-           END"""
-    ).fetchall()
-    result = [dict(r) for r in rows]
+    cur = conn.execute(_COMPLEXITY_METRICS_SQL)
+    result = _dict_rows(cur)
     log.debug("Fetched %d complexity metric rows", len(result))
     return result
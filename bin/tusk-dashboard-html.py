@@ -6,13 +6,18 @@ section builders. Imported by tusk-dashboard.py via importlib.
 Not a standalone CLI command — imported by tusk-dashboard.py via tusk_loader.
 """
 
+import calendar
+import functools
 import html
 import json
 import logging
 import os
+import re
 import sys
+from bisect import bisect_right
 from collections import defaultdict, deque
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from itertools import accumulate
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 import tusk_loader  # loads tusk-dashboard-css.py and tusk-dashboard-js.py
@@ -20,6 +25,15 @@ import tusk_loader  # loads tusk-dashboard-css.py and tusk-dashboard-js.py
 log = logging.getLogger(__name__)
 
 
+# Shared encoder for the JSON payloads inlined into <script> blocks
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def script_json(obj) -> str:
+    """Serialize *obj* as JSON that is safe to inline in a <script> block."""
+    return _JSON_ENCODER.encode(obj).replace("</", "<\\/")
+
+
 # Expected session ranges per complexity tier (from CLAUDE.md)
 EXPECTED_SESSIONS = {
     'XS': (0.5, 1),
@@ -30,26 +44,72 @@ EXPECTED_SESSIONS = {
 }
 
 COMPLEXITY_SORT_ORDER = {'XS': 1, 'S': 2, 'M': 3, 'L': 4, 'XL': 5}
+# Bound lookup for the per-row sort key; '' (unsized) sorts first. Unknown
+# tiers (custom config complexity values) still fall back to 0.
+_complexity_sort_key = {'': 0, **COMPLEXITY_SORT_ORDER}.get
+# Default status / complexity / task-type vocabulary: these contain no HTML
+# special characters, so rows pass them through without escaping. Custom
+# config values still go through esc().
+_SAFE_ENUM_VALUES = frozenset({
+    "To Do", "In Progress", "Done",
+    *COMPLEXITY_SORT_ORDER,
+    "bug", "feature", "refactor", "test", "docs", "infrastructure", "issue",
+})
+
+# Pre-rendered Size cell contents for the standard tiers; custom tiers are
+# escaped and wrapped per row.
+_COMPLEXITY_BADGE_HTML = {
+    '': '',
+    **{k: f'<span class="complexity-badge">{k}</span>' for k in COMPLEXITY_SORT_ORDER},
+}
 
 
 # ---------------------------------------------------------------------------
 # Formatting helpers
 # ---------------------------------------------------------------------------
 
+# Placeholder for empty/zero cells
+_MUTED_DASH = '<span class="text-muted-dash">&mdash;</span>'
+
+# Pure numeric formatters are memoized: rows repeat the same values (0 tokens,
+# $0.00, identical durations) far more often than they differ.
+
+@functools.lru_cache(maxsize=4096)
+def _esc_short(text: str) -> str:
+    return html.escape(text)
+
+
 def esc(text) -> str:
-    """HTML-escape a value, handling None."""
+    """HTML-escape a value, handling None.
+
+    Short strings (statuses, domains, tiers, labels) repeat on nearly every row,
+    so they are memoized; long free text is escaped directly to keep it out of
+    the cache.
+    """
     if text is None:
         return ""
-    return html.escape(str(text))
+    if not isinstance(text, str):
+        text = str(text)
+    if len(text) <= 64:
+        return _esc_short(text)
+    return html.escape(text)
+
+
+# Pre-rendered strings for small counts, which need no thousands separator
+_SMALL_NUMBERS = {i: str(i) for i in range(1000)}
 
 
 def format_number(n) -> str:
     """Format a number with commas."""
     if n is None:
         return "0"
+    small = _SMALL_NUMBERS.get(n)
+    if small is not None:
+        return small
     return f"{int(n):,}"
 
 
+@functools.lru_cache(maxsize=4096)
 def format_cost(c) -> str:
     """Format a dollar amount."""
     if c is None or c == 0:
@@ -57,6 +117,7 @@ def format_cost(c) -> str:
     return f"${c:,.2f}"
 
 
+@functools.lru_cache(maxsize=4096)
 def format_duration(seconds) -> str:
     """Format seconds as a human-readable duration."""
     if seconds is None or seconds == 0:
@@ -82,10 +143,22 @@ def format_status_duration(seconds) -> str:
     return f"{minutes}m"
 
 
+# Full shape of the timestamps SQLite's datetime('now') and CURRENT_TIMESTAMP write
+_SQLITE_DT_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]{1,6})?")
+
+
 def _parse_dt(dt_str: str) -> datetime | None:
     """Parse a datetime string (assumed UTC) and return a UTC-aware datetime."""
     if not dt_str:
         return None
+    # Fast path: the 'YYYY-MM-DD HH:MM:SS[.ffffff]' shape SQLite writes. Match the
+    # whole string first so fromisoformat's extra forms (date-only, 'T', 'Z',
+    # offsets, 7+ fraction digits) stay rejected, as they are by strptime below.
+    if _SQLITE_DT_RE.fullmatch(dt_str):
+        try:
+            return datetime.fromisoformat(dt_str).replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
     for fmt in ("%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S"):
         try:
             return datetime.strptime(dt_str, fmt).replace(tzinfo=timezone.utc)
@@ -97,16 +170,17 @@ def _parse_dt(dt_str: str) -> datetime | None:
 def format_date(dt_str) -> str:
     """Format an ISO datetime string as YYYY-MM-DD HH:MM:SS in local timezone."""
     if dt_str is None:
-        return '<span class="text-muted-dash">&mdash;</span>'
+        return _MUTED_DASH
     dt = _parse_dt(dt_str)
     if dt is None:
         return esc(dt_str)
     local_dt = dt.astimezone()
     if local_dt.microsecond:
-        return local_dt.strftime("%Y-%m-%d %H:%M:%S.") + f"{local_dt.microsecond // 1000:03d}"
-    return local_dt.strftime("%Y-%m-%d %H:%M:%S")
+        return f"{local_dt:%Y-%m-%d %H:%M:%S}.{local_dt.microsecond // 1000:03d}"
+    return f"{local_dt:%Y-%m-%d %H:%M:%S}"
 
 
+@functools.lru_cache(maxsize=4096)
 def format_tokens_compact(n) -> str:
     """Format token count compactly (e.g., 1.6M, 234K, 56)."""
     if n is None or n == 0:
@@ -143,24 +217,30 @@ def format_relative_time(dt_str) -> str:
     return f"{seconds // 31536000}y ago"
 
 
+_LINES_ADDED = '<span class="lines-added">+{:d}</span>'.format
+_LINES_REMOVED = '<span class="lines-removed">\u2212{:d}</span>'.format
+_LINES_BOTH = '<span class="lines-added">+{:d}</span> / <span class="lines-removed">\u2212{:d}</span>'.format
+
+
 def format_lines_html(added, removed) -> str:
     """Format lines changed as colored +N / -M HTML."""
     added = added or 0
     removed = removed or 0
     if added == 0 and removed == 0:
-        return '<span class="text-muted-dash">&mdash;</span>'
-    parts = []
+        return _MUTED_DASH
     if added > 0:
-        parts.append(f'<span class="lines-added">+{int(added)}</span>')
+        if removed > 0:
+            return _LINES_BOTH(int(added), int(removed))
+        return _LINES_ADDED(int(added))
     if removed > 0:
-        parts.append(f'<span class="lines-removed">\u2212{int(removed)}</span>')
-    return " / ".join(parts)
+        return _LINES_REMOVED(int(removed))
+    return ""
 
 
 def format_ctx_pct(pct, color: bool = False) -> str:
     """Format a context window percentage value, with optional color coding."""
     if pct is None:
-        return '<span class="text-muted-dash">&mdash;</span>'
+        return _MUTED_DASH
     pct_f = float(pct)
     label = f"{pct_f:.1f}%"
     if not color:
@@ -174,22 +254,16 @@ def format_ctx_pct(pct, color: bool = False) -> str:
     return f'<span style="{style}">{label}</span>'
 
 
+# Lower bound (as a fraction of the max task cost) of each cost heat tier
+_HEAT_THRESHOLDS = (0.10, 0.25, 0.45, 0.65, 0.85)
+_HEAT_CLASSES = ("", "cost-heat-1", "cost-heat-2", "cost-heat-3", "cost-heat-4", "cost-heat-5")
+
+
 def cost_heat_class(cost: float, max_cost: float) -> str:
     """Return a CSS class for cost heatmap tinting."""
     if max_cost <= 0 or cost <= 0:
         return ""
-    ratio = cost / max_cost
-    if ratio < 0.10:
-        return ""
-    if ratio < 0.25:
-        return "cost-heat-1"
-    if ratio < 0.45:
-        return "cost-heat-2"
-    if ratio < 0.65:
-        return "cost-heat-3"
-    if ratio < 0.85:
-        return "cost-heat-4"
-    return "cost-heat-5"
+    return _HEAT_CLASSES[bisect_right(_HEAT_THRESHOLDS, cost / max_cost)]
 
 
 # ---------------------------------------------------------------------------
@@ -342,9 +416,78 @@ def build_mermaid(tasks: list[dict], edges: list[dict], blockers: list[dict]) ->
 # HTML section generators
 # ---------------------------------------------------------------------------
 
-def generate_css() -> str:
-    """Generate the full CSS wrapped in a <style> block."""
-    return '<style>\n' + tusk_loader.load("tusk-dashboard-css").CSS + '\n</style>'
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+
+
+def _strip_lines(text: str, comment_prefix: str | None = None) -> str:
+    """Drop indentation, blank lines and (optionally) whole-line comments."""
+    lines = (line.strip() for line in text.splitlines())
+    return "\n".join(
+        line for line in lines
+        if line and not (comment_prefix and line.startswith(comment_prefix))
+    )
+
+
+def minify_css(css: str) -> str:
+    """Strip comments and layout whitespace from CSS (newlines are kept)."""
+    return _strip_lines(_CSS_COMMENT_RE.sub("", css))
+
+
+def minify_js(js: str) -> str:
+    """Strip indentation, blank lines and whole-line // comments from JS.
+
+    Conservative by design: statements and line breaks are kept, so ASI and
+    regex/string literals behave exactly as in the source. The dashboard JS has
+    no multi-line template literals, which this would otherwise alter.
+    """
+    return _strip_lines(js, "//")
+
+
+@functools.lru_cache(maxsize=None)
+def dashboard_css() -> str:
+    """Return the minified dashboard stylesheet."""
+    return minify_css(tusk_loader.load("tusk-dashboard-css").CSS)
+
+
+@functools.lru_cache(maxsize=None)
+def dashboard_js() -> str:
+    """Return the minified dashboard JavaScript."""
+    return minify_js(tusk_loader.load("tusk-dashboard-js").JS)
+
+
+# File names used by write_assets() and the <link>/<script src> tags
+CSS_ASSET = "tusk-dashboard.css"
+JS_ASSET = "tusk-dashboard.js"
+
+
+def write_assets(outdir: str) -> list[str]:
+    """Write the dashboard CSS and JS next to the HTML; return their paths.
+
+    Files whose content is already current are left untouched so their
+    mtimes (and the browser's cached copy) stay valid.
+    """
+    paths = []
+    for name, text in ((CSS_ASSET, dashboard_css()), (JS_ASSET, dashboard_js())):
+        path = os.path.join(outdir, name)
+        data = text.encode("utf-8")
+        try:
+            with open(path, "rb") as f:
+                current = f.read() == data
+        except OSError:
+            current = False
+        if not current:
+            with open(path, "wb") as f:
+                f.write(data)
+        paths.append(path)
+    return paths
+
+
+@functools.lru_cache(maxsize=None)
+def generate_css(external: bool = False) -> str:
+    """Generate the CSS: inline in a <style> block, or a <link> to CSS_ASSET."""
+    if external:
+        return f'<link rel="stylesheet" href="{CSS_ASSET}">'
+    return '<style>\n' + dashboard_css() + '\n</style>'
 
 
 def generate_header(now: str, tz_label: str = "", project_name: str = "Tusk") -> str:
@@ -419,11 +562,12 @@ def _generate_tool_stats_panel(tool_stats: list[dict]) -> str:
     if not tool_stats:
         return ""
     task_total = sum(r["total_cost"] or 0 for r in tool_stats)
-    tool_rows = ""
+    buf: list[str] = []
+    a = buf.append
     for r in tool_stats:
         tool_cost = r["total_cost"] or 0
         tool_pct = (tool_cost / task_total * 100) if task_total > 0 else 0
-        tool_rows += (
+        a(
             f'<tr class="tc-row">'
             f'<td class="tc-tool">{esc(r["tool_name"])}</td>'
             f'<td class="tc-calls" style="text-align:right;font-variant-numeric:tabular-nums;">{int(r["call_count"] or 0):,}</td>'
@@ -438,6 +582,7 @@ def _generate_tool_stats_panel(tool_stats: list[dict]) -> str:
             f'</td>'
             f'</tr>\n'
         )
+    tool_rows = "".join(buf)
     return (
         f'<details class="tc-task-panel tc-task-panel--bordered">'
         f'<summary style="padding:var(--sp-2) var(--sp-4);cursor:pointer;list-style:none;'
@@ -537,7 +682,8 @@ def generate_skill_runs_section(skill_runs: list[dict], tool_stats_by_run: dict
             bg = ""
         return f"text-align:right;font-variant-numeric:tabular-nums;{bg}"
 
-    table_rows = ""
+    buf: list[str] = []
+    a = buf.append
     for r in skill_runs:
         cost = r.get('cost_dollars') or 0
         cost_str = f"${cost:.4f}"
@@ -553,7 +699,7 @@ def generate_skill_runs_section(skill_runs: list[dict], tool_stats_by_run: dict
             dur_secs = (end_dt - start_dt).total_seconds()
             dur_str = format_duration(dur_secs)
         else:
-            dur_str = '<span class="text-muted-dash">&mdash;</span>'
+            dur_str = _MUTED_DASH
 
         is_top3 = r['id'] in top3_ids
         badge = (
@@ -566,7 +712,7 @@ def generate_skill_runs_section(skill_runs: list[dict], tool_stats_by_run: dict
         run_tool_stats = tool_stats_by_run.get(r['id'], [])
         tool_panel_html = _generate_tool_stats_panel(run_tool_stats)
 
-        table_rows += (
+        a(
             f"<tr{row_style}>"
             f"<td>{r['id']}</td>"
             f"<td>{skill_str}{badge}</td>"
@@ -579,11 +725,12 @@ def generate_skill_runs_section(skill_runs: list[dict], tool_stats_by_run: dict
             f"</tr>\n"
         )
         if tool_panel_html:
-            table_rows += (
+            a(
                 f'<tr><td colspan="8" style="padding:0;">'
                 f'{tool_panel_html}'
                 f'</td></tr>\n'
             )
+    table_rows = "".join(buf)
 
     return f"""\
 <div class="panel" style="margin-bottom: var(--sp-6);">
@@ -611,6 +758,10 @@ def generate_skill_runs_section(skill_runs: list[dict], tool_stats_by_run: dict
 
 
 
+# Month abbreviations as strftime("%b") spells them, resolved once at import
+_MONTH_ABBR = tuple(calendar.month_abbr)
+
+
 def _format_chart_labels(rows: list[dict], period_key: str, period_label: str) -> list[str]:
     """Format period strings into human-readable chart labels."""
     labels = []
@@ -618,11 +769,11 @@ def _format_chart_labels(rows: list[dict], period_key: str, period_label: str) -
         raw = row[period_key]
         try:
             if period_label == "Daily":
-                dt = datetime.strptime(raw, "%Y-%m-%d")
-                labels.append(dt.strftime("%b %d, %Y"))
+                d = date.fromisoformat(raw)
+                labels.append(f"{_MONTH_ABBR[d.month]} {d.day:02d}, {d.year}")
             elif period_label == "Monthly":
-                dt = datetime.strptime(raw + "-01", "%Y-%m-%d")
-                labels.append(dt.strftime("%b %Y"))
+                d = date.fromisoformat(raw + "-01")
+                labels.append(f"{_MONTH_ABBR[d.month]} {d.year}")
             else:
                 labels.append(f"Week of {raw}")
         except ValueError:
@@ -634,29 +785,32 @@ def _build_chart_dataset(rows: list[dict], period_key: str, cost_key: str, perio
     """Build a JSON-serializable dataset for a cost trend period."""
     labels = _format_chart_labels(rows, period_key, period_label)
     costs = [row[cost_key] for row in rows]
-    cumulative = []
-    running = 0.0
-    for c in costs:
-        running += c
-        cumulative.append(round(running, 2))
+    cumulative = [round(running, 2) for running in accumulate(costs)]
     return {"labels": labels, "costs": costs, "cumulative": cumulative}
 
 
+# Serialized trend payload when a source has no cost data in any period
+_EMPTY_TREND_JSON = script_json({
+    period: {"labels": [], "costs": [], "cumulative": []}
+    for period in ("daily", "weekly", "monthly")
+})
+
+
 def generate_cost_trend_section(cost_trend: list[dict], cost_trend_daily: list[dict],
                                 cost_trend_monthly: list[dict], skill_runs: list[dict] = None) -> str:
     """Generate Cost Trend panel with period toggle and separate Task/Skill charts."""
     skill_runs = skill_runs or []
 
     # --- Task chart data ---
-    daily_data = _build_chart_dataset(cost_trend_daily, "day", "daily_cost", "Daily")
-    weekly_data = _build_chart_dataset(cost_trend, "week_start", "weekly_cost", "Weekly")
-    monthly_data = _build_chart_dataset(cost_trend_monthly, "month", "monthly_cost", "Monthly")
-    chart_data = json.dumps({
-        "daily": daily_data,
-        "weekly": weekly_data,
-        "monthly": monthly_data,
-    }).replace("</", "<\\/")
-    has_cost_data = any(d["costs"] for d in [daily_data, weekly_data, monthly_data])
+    has_cost_data = bool(cost_trend_daily or cost_trend or cost_trend_monthly)
+    if has_cost_data:
+        chart_data = script_json({
+            "daily": _build_chart_dataset(cost_trend_daily, "day", "daily_cost", "Daily"),
+            "weekly": _build_chart_dataset(cost_trend, "week_start", "weekly_cost", "Weekly"),
+            "monthly": _build_chart_dataset(cost_trend_monthly, "month", "monthly_cost", "Monthly"),
+        })
+    else:
+        chart_data = _EMPTY_TREND_JSON
     empty_msg = '<p class="empty" style="padding:var(--sp-4) 0;">No session cost data available yet.</p>' if not has_cost_data else ''
 
     # --- Skill trend data (aggregated by day/week/month) ---
@@ -678,15 +832,18 @@ def generate_cost_trend_section(cost_trend: list[dict], cost_trend_daily: list[d
         skill_weekly_agg[week_start] = round(skill_weekly_agg.get(week_start, 0) + cost, 4)
         skill_monthly_agg[month_key] = round(skill_monthly_agg.get(month_key, 0) + cost, 4)
 
-    skill_daily_rows = [{"day": k, "daily_cost": v} for k, v in sorted(skill_daily_agg.items())]
-    skill_weekly_rows = [{"week_start": k, "weekly_cost": v} for k, v in sorted(skill_weekly_agg.items())]
-    skill_monthly_rows = [{"month": k, "monthly_cost": v} for k, v in sorted(skill_monthly_agg.items())]
-    skill_trend_data = json.dumps({
-        "daily": _build_chart_dataset(skill_daily_rows, "day", "daily_cost", "Daily"),
-        "weekly": _build_chart_dataset(skill_weekly_rows, "week_start", "weekly_cost", "Weekly"),
-        "monthly": _build_chart_dataset(skill_monthly_rows, "month", "monthly_cost", "Monthly"),
-    }).replace("</", "<\\/")
     has_skill_trend = bool(skill_daily_agg or skill_weekly_agg or skill_monthly_agg)
+    if has_skill_trend:
+        skill_daily_rows = [{"day": k, "daily_cost": v} for k, v in sorted(skill_daily_agg.items())]
+        skill_weekly_rows = [{"week_start": k, "weekly_cost": v} for k, v in sorted(skill_weekly_agg.items())]
+        skill_monthly_rows = [{"month": k, "monthly_cost": v} for k, v in sorted(skill_monthly_agg.items())]
+        skill_trend_data = script_json({
+            "daily": _build_chart_dataset(skill_daily_rows, "day", "daily_cost", "Daily"),
+            "weekly": _build_chart_dataset(skill_weekly_rows, "week_start", "weekly_cost", "Weekly"),
+            "monthly": _build_chart_dataset(skill_monthly_rows, "month", "monthly_cost", "Monthly"),
+        })
+    else:
+        skill_trend_data = _EMPTY_TREND_JSON
     empty_skill_msg = '<p class="empty" style="padding:var(--sp-4) 0;">No skill cost data available yet.</p>' if not has_skill_trend else ''
 
     task_chart_hidden = ' display:none;' if not has_cost_data else ''
@@ -848,6 +1005,26 @@ def generate_table_header() -> str:
 </thead>"""
 
 
+_DEP_BADGE = '<a class="dep-link dep-type-{type}" data-target="{tid}" title="{tooltip}">#{tid}</a>'.format_map
+
+
+def _dep_group_html(label: str, deps: list[dict], summary_map: dict, esc_type: dict) -> str:
+    """Render one labelled group of dependency badges (Blocked by / Blocks).
+
+    ``esc_type`` caches escaped relationship types across both groups of a row;
+    a task's dependencies almost always share one or two type values.
+    """
+    badges = "".join(
+        _DEP_BADGE({
+            "type": esc_type.get(d["type"]) or esc_type.setdefault(d["type"], esc(d["type"])),
+            "tid": d["id"],
+            "tooltip": esc(summary_map[d["id"]]) if d["id"] in summary_map else f"Task #{d['id']}",
+        })
+        for d in deps
+    )
+    return f'<span class="dep-group"><span class="dep-label">{label}</span> {badges}</span>'
+
+
 def build_dep_badges(tid: int, task_deps: dict, summary_map: dict) -> str:
     """Build HTML for dependency badges, or empty string if none."""
     deps = task_deps.get(tid)
@@ -857,119 +1034,197 @@ def build_dep_badges(tid: int, task_deps: dict, summary_map: dict) -> str:
     blocks = deps.get("blocks", [])
     if not blocked_by and not blocks:
         return ""
+    esc_type: dict[str, str] = {}
     parts = []
     if blocked_by:
-        badges = []
-        for d in blocked_by:
-            tooltip = esc(summary_map.get(d["id"], f"Task #{d['id']}"))
-            css = f'dep-link dep-type-{esc(d["type"])}'
-            badges.append(
-                f'<a class="{css}" data-target="{d["id"]}" title="{tooltip}">#{d["id"]}</a>'
-            )
-        parts.append(
-            f'<span class="dep-group"><span class="dep-label">Blocked by</span> {"".join(badges)}</span>'
-        )
+        parts.append(_dep_group_html("Blocked by", blocked_by, summary_map, esc_type))
     if blocks:
-        badges = []
-        for d in blocks:
-            tooltip = esc(summary_map.get(d["id"], f"Task #{d['id']}"))
-            css = f'dep-link dep-type-{esc(d["type"])}'
-            badges.append(
-                f'<a class="{css}" data-target="{d["id"]}" title="{tooltip}">#{d["id"]}</a>'
-            )
-        parts.append(
-            f'<span class="dep-group"><span class="dep-label">Blocks</span> {"".join(badges)}</span>'
-        )
+        parts.append(_dep_group_html("Blocks", blocks, summary_map, esc_type))
     return f'<div class="dep-badges">{"".join(parts)}</div>'
 
 
+_CRITERIA_SORT_BAR = (
+    '<div class="criteria-sort-bar">'
+    '<span class="criteria-sort-label">Sort:</span>'
+    '<button class="criteria-sort-btn" data-sort-key="completed">Completed <span class="sort-arrow">&#9650;</span></button>'
+    '<button class="criteria-sort-btn" data-sort-key="cost">Cost <span class="sort-arrow">&#9650;</span></button>'
+    '<button class="criteria-sort-btn" data-sort-key="commit">Commit <span class="sort-arrow">&#9650;</span></button>'
+    '</div>'
+)
+# Static pieces of the detail row; only the task id varies between tasks.
+_CRITERIA_ROW_OPEN = '<tr class="criteria-row" data-parent="'
+_CRITERIA_ROW_CELL = '" style="display:none">\n  <td colspan="15">'
+_CRITERIA_ROW_CLOSE = '</td>\n</tr>\n'
+_CRITERIA_PANEL_OPEN = '<div class="criteria-detail" data-tid="'
+_CRITERIA_PANEL_BODY = '">' + _CRITERIA_SORT_BAR + '<div class="criteria-render-target"></div></div>'
+
+
 def generate_criteria_detail(tid: int, has_criteria: bool = True, tool_stats: list[dict] = None) -> str:
     """Generate the collapsible detail row for a task.
 
     Contains an optional criteria panel (client-side rendered from JSON) and
     an optional tool cost breakdown panel (server-side rendered).
     """
-    inner = ""
-
-    if has_criteria:
-        sort_bar = (
-            '<div class="criteria-sort-bar">'
-            '<span class="criteria-sort-label">Sort:</span>'
-            '<button class="criteria-sort-btn" data-sort-key="completed">Completed <span class="sort-arrow">&#9650;</span></button>'
-            '<button class="criteria-sort-btn" data-sort-key="cost">Cost <span class="sort-arrow">&#9650;</span></button>'
-            '<button class="criteria-sort-btn" data-sort-key="commit">Commit <span class="sort-arrow">&#9650;</span></button>'
-            '</div>'
-        )
-        inner += (
-            f'<div class="criteria-detail" data-tid="{tid}">'
-            f'{sort_bar}'
-            f'<div class="criteria-render-target"></div>'
-            f'</div>'
-        )
-
-    if tool_stats:
-        inner += _generate_tool_stats_panel(tool_stats)
-
+    tid_str = str(tid)
+    criteria_panel = _CRITERIA_PANEL_OPEN + tid_str + _CRITERIA_PANEL_BODY if has_criteria else ""
+    tool_panel = _generate_tool_stats_panel(tool_stats) if tool_stats else ""
     return (
-        f'<tr class="criteria-row" data-parent="{tid}" style="display:none">\n'
-        f'  <td colspan="15">{inner}</td>\n'
-        f'</tr>\n'
+        _CRITERIA_ROW_OPEN + tid_str + _CRITERIA_ROW_CELL
+        + criteria_panel + tool_panel + _CRITERIA_ROW_CLOSE
     )
 
 
+@functools.lru_cache(maxsize=64)
+def _status_badge_class(status_val: str) -> str:
+    """Return the badge CSS class for an escaped status ('In Progress' -> 'status-in-progress')."""
+    return "status-" + status_val.lower().replace(" ", "-")
+
+
+_EXPAND_ICON = '<span class="expand-icon">&#9654;</span> '
+
+# Row class attribute keyed by (has_session_data, has_expandable_detail)
+_ROW_CLASS_ATTR = {
+    (True, False): '',
+    (True, True): ' class="expandable"',
+    (False, False): ' class="muted"',
+    (False, True): ' class="muted expandable"',
+}
+
+
+# Task row template, parsed once; generate_task_row fills it with format_map.
+_ROW_TMPL_SRC = """<tr{cls_attr} data-status="{status_val}" data-summary="{summary_lower}" data-task-id="{tid:d}" data-complexity="{complexity_val}" data-type="{task_type_val}">
+  <td class="col-id" data-sort="{tid:d}">{toggle_icon}#{tid:d}</td>
+  <td class="col-summary"><div class="summary-text">{summary_esc}</div>{dep_badges}</td>
+  <td class="{cost_cls}" data-sort="{total_cost}">{cost_html}</td>
+  <td class="col-status"><span class="status-badge {status_cls}">{status_val}</span></td>
+  <td class="col-status-duration" data-sort="{status_duration_seconds}" style="text-align:right">{status_duration_html}</td>
+  <td class="col-complexity" data-sort="{complexity_sort}">{complexity_badge}</td>
+  <td class="col-wsjf" data-sort="{priority_score}">{priority_score}</td>
+  <td class="col-model" data-sort="{models_val}" title="{models_val}">{models_html}</td>
+  <td class="col-duration" data-sort="{duration_seconds}">{duration_html}</td>
+  <td class="col-lines" data-sort="{total_lines:d}" data-lines-added="{lines_added:d}" data-lines-removed="{lines_removed:d}">{lines_html}</td>
+  <td class="col-tokens-in" data-sort="{tokens_in}">{tokens_in_html}</td>
+  <td class="col-tokens-out" data-sort="{tokens_out}">{tokens_out_html}</td>
+  <td class="col-ctx-start" data-sort="{first_ctx_sort}" style="text-align:right">{first_ctx_html}</td>
+  <td class="col-ctx-peak" data-sort="{peak_ctx_sort}" style="text-align:right">{peak_ctx_html}</td>
+  <td class="col-ctx-end" data-sort="{last_ctx_sort}" style="text-align:right">{last_ctx_html}</td>
+</tr>
+"""
+_ROW_TMPL = _ROW_TMPL_SRC.format_map
+
+# Rows without sessions: every session-derived cell (cost, model, work time,
+# lines, tokens, context %) is baked in, leaving only task fields to fill.
+_MUTED_ROW_FIELDS = {
+    "{cost_cls}": "col-cost",
+    "{total_cost}": "0",
+    "{cost_html}": format_cost(0),
+    "{models_val}": "",
+    "{models_html}": _MUTED_DASH,
+    "{duration_seconds}": "0",
+    "{duration_html}": _MUTED_DASH,
+    "{total_lines:d}": "0",
+    "{lines_added:d}": "0",
+    "{lines_removed:d}": "0",
+    "{lines_html}": _MUTED_DASH,
+    "{tokens_in}": "0",
+    "{tokens_in_html}": format_tokens_compact(0),
+    "{tokens_out}": "0",
+    "{tokens_out_html}": format_tokens_compact(0),
+    "{first_ctx_sort}": "-1",
+    "{first_ctx_html}": _MUTED_DASH,
+    "{peak_ctx_sort}": "-1",
+    "{peak_ctx_html}": _MUTED_DASH,
+    "{last_ctx_sort}": "-1",
+    "{last_ctx_html}": _MUTED_DASH,
+}
+_MUTED_ROW_TMPL_SRC = _ROW_TMPL_SRC
+for _field, _value in _MUTED_ROW_FIELDS.items():
+    _MUTED_ROW_TMPL_SRC = _MUTED_ROW_TMPL_SRC.replace(_field, _value)
+_MUTED_ROW_TMPL = _MUTED_ROW_TMPL_SRC.format_map
+del _field, _value
+
+
 def generate_task_row(t: dict, criteria_list: list[dict], task_deps: dict, summary_map: dict, max_cost: float = 0, tool_stats: list[dict] = None) -> str:
     """Generate a single task table row (and optional criteria/tool-cost detail row)."""
-    has_data = t["session_count"] > 0
-    status_val = esc(t['status'])
+    # Unpack every field once so the template dict below does no repeated lookups
     tid = t['id']
-    has_criteria = len(criteria_list) > 0
-    has_tool_stats = bool(tool_stats)
-    has_expandable = has_criteria or has_tool_stats
-    toggle_icon = '<span class="expand-icon">&#9654;</span> ' if has_expandable else ''
-
-    row_classes = []
-    if not has_data:
-        row_classes.append('muted')
-    if has_expandable:
-        row_classes.append('expandable')
-    cls_attr = f' class="{" ".join(row_classes)}"' if row_classes else ''
-
+    summary = t['summary']
+    status = t['status']
+    session_count = t['session_count'] or 0
+    total_cost = t['total_cost']
+    tokens_in = t['total_tokens_in']
+    tokens_out = t['total_tokens_out']
+    complexity = t.get('complexity') or ''
+    task_type = t.get('task_type') or ''
     priority_score = t.get('priority_score') or 0
-    complexity_val = esc(t.get('complexity') or '')
-    complexity_sort = COMPLEXITY_SORT_ORDER.get(t.get('complexity') or '', 0)
-    domain_val = esc(t.get('domain') or '')
-    task_type_val = esc(t.get('task_type') or '')
-    session_count = t.get('session_count') or 0
     models_raw = t.get('models') or ''
     duration_seconds = t.get('total_duration_seconds') or 0
     status_duration_seconds = t.get('duration_in_status_seconds') or 0
-    lines_added = t.get('total_lines_added') or 0
-    lines_removed = t.get('total_lines_removed') or 0
-    total_lines = int(lines_added) + int(lines_removed)
-    dep_badges = build_dep_badges(tid, task_deps, summary_map)
-    summary_cell = f'<div class="summary-text">{esc(t["summary"])}</div>{dep_badges}'
-
-    # Cost heatmap class for the cost cell
-    heat_cls = cost_heat_class(t['total_cost'], max_cost)
-    cost_cls = f'col-cost {heat_cls}'.strip()
-
-    row = f"""<tr{cls_attr} data-status="{status_val}" data-summary="{esc(t['summary']).lower()}" data-task-id="{tid}" data-complexity="{complexity_val}" data-type="{task_type_val}">
-  <td class="col-id" data-sort="{tid}">{toggle_icon}#{tid}</td>
-  <td class="col-summary">{summary_cell}</td>
-  <td class="{cost_cls}" data-sort="{t['total_cost']}">{format_cost(t['total_cost'])}</td>
-  <td class="col-status"><span class="status-badge status-{status_val.lower().replace(' ', '-')}">{status_val}</span></td>
-  <td class="col-status-duration" data-sort="{status_duration_seconds}" style="text-align:right">{format_status_duration(status_duration_seconds) if status_duration_seconds else '<span class="text-muted-dash">&mdash;</span>'}</td>
-  <td class="col-complexity" data-sort="{complexity_sort}">{f'<span class="complexity-badge">{complexity_val}</span>' if complexity_val else ''}</td>
-  <td class="col-wsjf" data-sort="{priority_score}">{priority_score}</td>
-  <td class="col-model" data-sort="{esc(models_raw)}" title="{esc(models_raw)}">{esc(models_raw) if models_raw else '<span class="text-muted-dash">&mdash;</span>'}</td>
-  <td class="col-duration" data-sort="{duration_seconds}">{format_duration(duration_seconds) if duration_seconds else '<span class="text-muted-dash">&mdash;</span>'}</td>
-  <td class="col-lines" data-sort="{total_lines}" data-lines-added="{int(lines_added)}" data-lines-removed="{int(lines_removed)}">{format_lines_html(lines_added, lines_removed)}</td>
-  <td class="col-tokens-in" data-sort="{t['total_tokens_in']}">{format_tokens_compact(t['total_tokens_in'])}</td>
-  <td class="col-tokens-out" data-sort="{t['total_tokens_out']}">{format_tokens_compact(t['total_tokens_out'])}</td>
-  <td class="col-ctx-start" data-sort="{t.get('first_ctx_pct') if t.get('first_ctx_pct') is not None else -1}" style="text-align:right">{format_ctx_pct(t.get('first_ctx_pct'))}</td>
-  <td class="col-ctx-peak" data-sort="{t.get('peak_ctx_pct') if t.get('peak_ctx_pct') is not None else -1}" style="text-align:right">{format_ctx_pct(t.get('peak_ctx_pct'), color=True)}</td>
-  <td class="col-ctx-end" data-sort="{t.get('last_ctx_pct') if t.get('last_ctx_pct') is not None else -1}" style="text-align:right">{format_ctx_pct(t.get('last_ctx_pct'))}</td>
-</tr>\n"""
+    lines_added = int(t.get('total_lines_added') or 0)
+    lines_removed = int(t.get('total_lines_removed') or 0)
+    first_ctx_pct = t.get('first_ctx_pct')
+    peak_ctx_pct = t.get('peak_ctx_pct')
+    last_ctx_pct = t.get('last_ctx_pct')
+
+    status_val = status if status in _SAFE_ENUM_VALUES else esc(status)
+    has_criteria = bool(criteria_list)
+    has_expandable = has_criteria or bool(tool_stats)
+    toggle_icon = _EXPAND_ICON if has_expandable else ''
+    cls_attr = _ROW_CLASS_ATTR[session_count > 0, has_expandable]
+
+    complexity_val = complexity if complexity in _SAFE_ENUM_VALUES else esc(complexity)
+    complexity_badge = _COMPLEXITY_BADGE_HTML.get(complexity)
+    if complexity_badge is None:
+        complexity_badge = f'<span class="complexity-badge">{complexity_val}</span>'
+    summary_esc = esc(summary)
+
+    fields = {
+        "cls_attr": cls_attr,
+        "status_val": status_val,
+        "summary_lower": summary_esc.lower(),
+        "tid": tid,
+        "complexity_val": complexity_val,
+        "task_type_val": task_type if task_type in _SAFE_ENUM_VALUES else esc(task_type),
+        "toggle_icon": toggle_icon,
+        "summary_esc": summary_esc,
+        "dep_badges": build_dep_badges(tid, task_deps, summary_map),
+        "status_cls": _status_badge_class(status_val),
+        "status_duration_seconds": status_duration_seconds,
+        "status_duration_html": format_status_duration(status_duration_seconds) if status_duration_seconds else _MUTED_DASH,
+        "complexity_sort": _complexity_sort_key(complexity, 0),
+        "complexity_badge": complexity_badge,
+        "priority_score": priority_score,
+    }
+    if session_count:
+        models_val = esc(models_raw)
+        # Cost heatmap class for the cost cell
+        heat_cls = cost_heat_class(total_cost, max_cost)
+        fields.update({
+            "cost_cls": f'col-cost {heat_cls}'.strip(),
+            "total_cost": total_cost,
+            "cost_html": format_cost(total_cost),
+            "models_val": models_val,
+            "models_html": models_val if models_raw else _MUTED_DASH,
+            "duration_seconds": duration_seconds,
+            "duration_html": format_duration(duration_seconds) if duration_seconds else _MUTED_DASH,
+            "total_lines": lines_added + lines_removed,
+            "lines_added": lines_added,
+            "lines_removed": lines_removed,
+            "lines_html": format_lines_html(lines_added, lines_removed),
+            "tokens_in": tokens_in,
+            "tokens_in_html": format_tokens_compact(tokens_in),
+            "tokens_out": tokens_out,
+            "tokens_out_html": format_tokens_compact(tokens_out),
+            "first_ctx_sort": first_ctx_pct if first_ctx_pct is not None else -1,
+            "first_ctx_html": format_ctx_pct(first_ctx_pct),
+            "peak_ctx_sort": peak_ctx_pct if peak_ctx_pct is not None else -1,
+            "peak_ctx_html": format_ctx_pct(peak_ctx_pct, color=True),
+            "last_ctx_sort": last_ctx_pct if last_ctx_pct is not None else -1,
+            "last_ctx_html": format_ctx_pct(last_ctx_pct),
+        })
+        row = _ROW_TMPL(fields)
+    else:
+        row = _MUTED_ROW_TMPL(fields)
 
     if has_expandable:
         row += generate_criteria_detail(tid, has_criteria=has_criteria, tool_stats=tool_stats)
@@ -977,7 +1232,6 @@ def generate_task_row(t: dict, criteria_list: list[dict], task_deps: dict, summa
     return row
 
 
-
 def generate_pagination() -> str:
     """Generate the pagination bar."""
     return """\
@@ -1005,7 +1259,7 @@ def generate_complexity_section(complexity_metrics: list[dict] | None) -> str:
     if not complexity_metrics:
         return ""
 
-    complexity_rows = ""
+    rows: list[str] = []
     for c in complexity_metrics:
         tier = c['complexity']
         expected = EXPECTED_SESSIONS.get(tier, (0, 0))
@@ -1015,14 +1269,14 @@ def generate_complexity_section(complexity_metrics: list[dict] | None) -> str:
         exceeds = avg_sessions > hi
         row_css = ' class="tier-exceeds"' if exceeds else ''
         flag = ' <span class="tier-flag">&#9888;</span>' if exceeds else ''
-        complexity_rows += f"""<tr{row_css}>
+        rows.append(f"""<tr{row_css}>
   <td class="col-complexity"><span class="complexity-badge">{esc(tier)}</span></td>
   <td class="col-count">{c['task_count']}</td>
   <td class="col-expected">{expected_str}</td>
   <td class="col-avg-sessions">{c['avg_sessions']}{flag}</td>
   <td class="col-avg-duration">{format_duration(c['avg_duration_seconds'])}</td>
   <td class="col-avg-cost">{format_cost(c['avg_cost'])}</td>
-</tr>\n"""
+</tr>\n""")
 
     return f"""
 <div class="panel" style="margin-top: var(--sp-6);">
@@ -1039,7 +1293,7 @@ def generate_complexity_section(complexity_metrics: list[dict] | None) -> str:
       </tr>
     </thead>
     <tbody>
-      {complexity_rows}
+      {"".join(rows)}
     </tbody>
   </table>
 </div>"""
@@ -1101,10 +1355,10 @@ def generate_dag_section(dag_tasks: list[dict], edges: list[dict],
             "is_resolved": b["is_resolved"],
         }
 
-    task_json = json.dumps(task_data).replace("</", "<\\/")
-    blocker_json = json.dumps(blocker_data).replace("</", "<\\/")
-    mermaid_default_json = json.dumps(mermaid_default).replace("</", "<\\/")
-    mermaid_all_json = json.dumps(mermaid_all).replace("</", "<\\/")
+    task_json = script_json(task_data)
+    blocker_json = script_json(blocker_data)
+    mermaid_default_json = script_json(mermaid_default)
+    mermaid_all_json = script_json(mermaid_all)
 
     has_edges = len(edges) > 0 or len(dag_blockers) > 0
     hint = "" if has_edges else '<p class="dag-hint">No dependencies yet. Use <code>tusk deps add</code> to connect tasks.</p>'
@@ -1159,6 +1413,9 @@ var DAG_MERMAID_ALL = {mermaid_all_json};
 </div>"""
 
 
-def generate_js() -> str:
-    """Generate all dashboard JavaScript."""
-    return '<script>\n' + tusk_loader.load("tusk-dashboard-js").JS + '\n</script>'
+@functools.lru_cache(maxsize=None)
+def generate_js(external: bool = False) -> str:
+    """Generate all dashboard JavaScript: inline, or a <script src> for JS_ASSET."""
+    if external:
+        return f'<script src="{JS_ASSET}"></script>'
+    return '<script>\n' + dashboard_js() + '\n</script>'
@@ -12,7 +12,19 @@ JS: str = """\
   body.querySelectorAll('tr.criteria-row').forEach(function(cr) {
     criteriaRows[cr.getAttribute('data-parent')] = cr;
   });
-  var filtered = allRows.slice();
+  // Per-row filter fields and criteria row, read from the DOM once, so
+  // filtering and paging loops work on plain objects, not attribute lookups.
+  var rowData = allRows.map(function(r) {
+    return {
+      el: r,
+      criteriaEl: criteriaRows[r.getAttribute('data-task-id')] || null,
+      status: r.getAttribute('data-status'),
+      complexity: r.getAttribute('data-complexity'),
+      summaryLower: (r.getAttribute('data-summary') || '').toLowerCase(),
+      sortKeys: []
+    };
+  });
+  var filtered = rowData.slice();
   var currentPage = 1;
   var pageSize = 10;
   var sortCol = 2;
@@ -51,8 +63,8 @@ JS: str = """\
   var complexityOrder = ['XS', 'S', 'M', 'L', 'XL'];
   function populateComplexitySelect() {
     var values = {};
-    allRows.forEach(function(row) {
-      var v = row.getAttribute('data-complexity') || '';
+    rowData.forEach(function(d) {
+      var v = d.complexity || '';
       if (v) values[v] = true;
     });
     complexitySelect.innerHTML = '<option value="">Size</option>';
@@ -70,6 +82,9 @@ JS: str = """\
 
   // --- URL hash state ---
   var hashUpdateTimer = null;
+  // Set while the initial state is applied, so the filter/sort passes it
+  // runs collapse into at most one history write.
+  var suppressHash = false;
 
   function encodeHashState() {
     var params = [];
@@ -84,6 +99,7 @@ JS: str = """\
   }
 
   function pushHashState() {
+    if (suppressHash) return;
     if (hashUpdateTimer) clearTimeout(hashUpdateTimer);
     hashUpdateTimer = setTimeout(function() {
       var hash = encodeHashState();
@@ -122,14 +138,22 @@ JS: str = """\
     searchInput.value = searchTerm;
     // Page size
     pageSizeEl.value = pageSize.toString();
-    // Sort header highlight
-    headers.forEach(function(h) {
-      h.classList.remove('sort-asc', 'sort-desc');
-      h.querySelector('.sort-arrow').textContent = '\\u25B2';
-    });
+    paintSortHeaders();
+  }
+
+  // Sort header highlight. Arrow spans are looked up once so repainting is
+  // writes only.
+  var headerArrows = Array.prototype.map.call(headers, function(h) {
+    return h.querySelector('.sort-arrow');
+  });
+  function paintSortHeaders() {
+    for (var i = 0; i < headers.length; i++) {
+      headers[i].classList.remove('sort-asc', 'sort-desc');
+      headerArrows[i].textContent = '\\u25B2';
+    }
     if (sortCol >= 0 && sortCol < headers.length) {
       headers[sortCol].classList.add(sortAsc ? 'sort-asc' : 'sort-desc');
-      headers[sortCol].querySelector('.sort-arrow').textContent = sortAsc ? '\\u25B2' : '\\u25BC';
+      headerArrows[sortCol].textContent = sortAsc ? '\\u25B2' : '\\u25BC';
     }
   }
 
@@ -157,8 +181,20 @@ JS: str = """\
     applyFilter();
   }
 
-  function formatCost(n) {
-    return '$' + n.toFixed(2).replace(/\\B(?=(\\d{3})+(?!\\d))/g, ',');
+  // One Intl formatter per precision, created on first use
+  var usdFormats = {};
+  function formatCost(n, digits) {
+    if (digits == null) digits = 2;
+    var fmt = usdFormats[digits];
+    if (!fmt) {
+      fmt = usdFormats[digits] = new Intl.NumberFormat('en-US', {
+        style: 'currency',
+        currency: 'USD',
+        minimumFractionDigits: digits,
+        maximumFractionDigits: digits
+      });
+    }
+    return fmt.format(n);
   }
 
   function formatTokensCompact(n) {
@@ -180,84 +216,132 @@ JS: str = """\
     return totalLines > 0 ? totalLines.toString() : '\\u2014';
   }
 
+  // Rows matching the last search term. Typing usually extends the term, and
+  // a row matching the longer term must match the shorter one, so the next
+  // search only rescans these rows instead of every summary.
+  var searchBase = '';
+  var searchMatches = rowData;
+  function matchSearch() {
+    if (!searchTerm) {
+      searchBase = '';
+      searchMatches = rowData;
+    } else if (searchTerm !== searchBase) {
+      var pool = searchBase && searchTerm.indexOf(searchBase) !== -1 ? searchMatches : rowData;
+      searchMatches = pool.filter(function(d) { return d.summaryLower.indexOf(searchTerm) !== -1; });
+      searchBase = searchTerm;
+    }
+    return searchMatches;
+  }
+
   function applyFilter() {
-    filtered = allRows.filter(function(row) {
-      if (statusFilter !== 'All' && row.getAttribute('data-status') !== statusFilter) return false;
-      if (complexityFilter && row.getAttribute('data-complexity') !== complexityFilter) return false;
-      if (searchTerm && row.getAttribute('data-summary').indexOf(searchTerm) === -1) return false;
+    filtered = matchSearch().filter(function(d) {
+      if (statusFilter !== 'All' && d.status !== statusFilter) return false;
+      if (complexityFilter && d.complexity !== complexityFilter) return false;
       return true;
     });
     currentPage = 1;
     updateFilterBadge();
     pushHashState();
-    render();
+    reorderDom();
+    paginate();
+  }
+
+  // Sort keys are read from the cells once per column, the first time that
+  // column is sorted, and cached on each row's entry in rowData.
+  var sortKeysReady = {};
+  function ensureSortKeys(col, type) {
+    if (sortKeysReady[col]) return;
+    sortKeysReady[col] = true;
+    rowData.forEach(function(d) {
+      var cell = d.el.children[col];
+      d.sortKeys[col] = type === 'num'
+        ? (parseFloat(cell.getAttribute('data-sort')) || 0)
+        : (cell.getAttribute('data-sort') || cell.textContent || '').toLowerCase();
+    });
   }
 
   function applySort() {
     if (sortCol < 0) return;
-    var type = headers[sortCol].getAttribute('data-type');
+    var col = sortCol;
+    var dir = sortAsc ? 1 : -1;
+    ensureSortKeys(col, headers[col].getAttribute('data-type'));
     filtered.sort(function(a, b) {
-      var cellA = a.children[sortCol];
-      var cellB = b.children[sortCol];
-      var vA, vB;
-      if (type === 'num') {
-        vA = parseFloat(cellA.getAttribute('data-sort')) || 0;
-        vB = parseFloat(cellB.getAttribute('data-sort')) || 0;
-      } else {
-        vA = (cellA.getAttribute('data-sort') || cellA.textContent || '').toLowerCase();
-        vB = (cellB.getAttribute('data-sort') || cellB.textContent || '').toLowerCase();
-      }
-      if (vA < vB) return sortAsc ? -1 : 1;
-      if (vA > vB) return sortAsc ? 1 : -1;
+      var vA = a.sortKeys[col];
+      var vB = b.sortKeys[col];
+      if (vA < vB) return -dir;
+      if (vA > vB) return dir;
       return 0;
     });
     pushHashState();
-    render();
+    reorderDom();
+    paginate();
   }
 
   function isFiltered() {
     return statusFilter !== 'All' || complexityFilter || searchTerm;
   }
 
-  function render() {
-    allRows.forEach(function(r) { r.style.display = 'none'; });
-    Object.keys(criteriaRows).forEach(function(k) { criteriaRows[k].style.display = 'none'; });
+  // Rows shown by the last paginate() call. The server renders every task
+  // row visible, so the first call hides them all.
+  var visibleRows = rowData.slice();
+
+  // Move the filtered rows (and their criteria rows) into display order.
+  // Rows are staged in a fragment (which detaches them) and committed to the
+  // tbody in one append. Only needed when order or membership of `filtered`
+  // changes; paging reuses the existing order. Criteria rows that have never
+  // been expanded stay hidden where they are; the expand handler moves one
+  // under its task row the first time it opens.
+  function reorderDom() {
+    var frag = document.createDocumentFragment();
+    for (var i = 0; i < filtered.length; i++) {
+      var d = filtered[i];
+      frag.appendChild(d.el);
+      if (d.criteriaEl && d.el._expanded !== undefined) frag.appendChild(d.criteriaEl);
+    }
+    body.appendChild(frag);
+  }
+
+  // Page count for the current filter and page size, set by paginate() and
+  // read by the Next button.
+  var maxPage = 1;
+
+  // Show the current page window, hiding only the previously visible rows.
+  function paginate() {
+    for (var v = 0; v < visibleRows.length; v++) {
+      visibleRows[v].el.style.display = 'none';
+      if (visibleRows[v].criteriaEl) visibleRows[v].criteriaEl.style.display = 'none';
+    }
 
+    var total = filtered.length;
     var start, end;
     if (pageSize === 0) {
+      maxPage = 1;
       start = 0;
-      end = filtered.length;
+      end = total;
     } else {
-      var maxPage = Math.max(1, Math.ceil(filtered.length / pageSize));
+      maxPage = Math.max(1, Math.ceil(total / pageSize));
       if (currentPage > maxPage) currentPage = maxPage;
       start = (currentPage - 1) * pageSize;
-      end = Math.min(start + pageSize, filtered.length);
+      end = Math.min(start + pageSize, total);
     }
 
-    for (var i = 0; i < filtered.length; i++) {
-      body.appendChild(filtered[i]);
-      var tid = filtered[i].getAttribute('data-task-id');
-      if (tid && criteriaRows[tid]) {
-        body.appendChild(criteriaRows[tid]);
-      }
-    }
-    for (var j = start; j < end; j++) {
-      filtered[j].style.display = '';
-      var jtid = filtered[j].getAttribute('data-task-id');
-      if (jtid && criteriaRows[jtid] && filtered[j].classList.contains('expanded')) {
-        criteriaRows[jtid].style.display = '';
+    visibleRows = filtered.slice(start, end);
+    for (var j = 0; j < visibleRows.length; j++) {
+      var d = visibleRows[j];
+      d.el.style.display = '';
+      if (d.criteriaEl && d.el._expanded) {
+        d.criteriaEl.style.display = '';
       }
     }
 
     if (pageSize === 0) {
-      pageInfo.textContent = filtered.length + ' tasks';
+      pageInfo.textContent = total + ' tasks';
       prevBtn.disabled = true;
       nextBtn.disabled = true;
     } else {
-      var maxP = Math.max(1, Math.ceil(filtered.length / pageSize));
-      pageInfo.textContent = 'Page ' + currentPage + ' of ' + maxP + ' (' + filtered.length + ' tasks)';
+      pageInfo.textContent = 'Page ' + currentPage + ' of ' + maxPage + ' (' + total + ' tasks)';
       prevBtn.disabled = currentPage <= 1;
-      nextBtn.disabled = currentPage >= maxP;
+      nextBtn.disabled = currentPage >= maxPage;
     }
   }
 
@@ -265,11 +349,18 @@ JS: str = """\
   var CDATA = window.CRITERIA_DATA || {};
   var criteriaRendered = {};
 
+  // String-level escaper (no DOM round trip), memoized by raw value. The memo
+  // is reset at the start of each criteria render to keep it bounded.
+  var ESC_MAP = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'};
+  var ESC_RE = /[&<>"']/g;
+  function escChar(c) { return ESC_MAP[c]; }
+  var escMemo = Object.create(null);
   function escHtml(s) {
     if (s == null) return '';
-    var d = document.createElement('div');
-    d.textContent = String(s);
-    return d.innerHTML;
+    s = String(s);
+    var out = escMemo[s];
+    if (out === undefined) out = escMemo[s] = s.replace(ESC_RE, escChar);
+    return out;
   }
 
   function toLocalDateStr(utcStr) {
@@ -329,24 +420,22 @@ JS: str = """\
 
     // Swimlane bar: one colored segment per call, width ∝ cost
     var minFlex = total > 0 ? total * 0.01 / events.length : 1;
-    var segs = '';
-    events.forEach(function(e) {
+    var segs = events.map(function(e) {
       var cost = e.cost_dollars || 0;
       var flexVal = total > 0 ? Math.max(cost, minFlex) : 1;
       var rt = relTimeFor(e);
       var tip = '#' + (e.call_sequence || 0) + ' ' + e.tool_name
         + ' ($' + cost.toFixed(4) + ')' + (rt ? ' ' + rt : '');
-      segs += '<span class="cr-tl-seg" style="flex:' + flexVal
+      return '<span class="cr-tl-seg" style="flex:' + flexVal
         + ';background:' + toolColor(e.tool_name) + '" title="'
         + tip.replace(/"/g, '&quot;') + '"></span>';
     });
-    var swimlane = '<div class="cr-tl-bar">' + segs + '</div>';
+    var swimlane = '<div class="cr-tl-bar">' + segs.join('') + '</div>';
 
     // Detail table rows
-    var rows = '';
-    events.forEach(function(e) {
+    var rows = events.map(function(e) {
       var cost = e.cost_dollars || 0;
-      rows += '<tr class="tc-row">'
+      return '<tr class="tc-row">'
         + '<td class="tc-seq">' + (e.call_sequence || 0) + '</td>'
         + '<td class="tc-tool"><span class="cr-tl-dot" style="background:'
         + toolColor(e.tool_name) + '"></span>' + escHtml(e.tool_name) + '</td>'
@@ -366,7 +455,7 @@ JS: str = """\
       + '<table class="tc-table">'
       + '<thead><tr><th class="tc-seq" style="text-align:right">#</th><th>Tool</th>'
       + '<th style="text-align:right">Cost</th><th class="tc-reltime">Time</th></tr></thead>'
-      + '<tbody>' + rows + '</tbody>'
+      + '<tbody>' + rows.join('') + '</tbody>'
       + '</table></div></details>';
   }
 
@@ -374,11 +463,10 @@ JS: str = """\
     if (!toolStats || toolStats.length === 0) return '';
     var total = 0;
     toolStats.forEach(function(t) { total += t.total_cost || 0; });
-    var rows = '';
-    toolStats.forEach(function(t) {
+    var rows = toolStats.map(function(t) {
       var cost = t.total_cost || 0;
       var pct = total > 0 ? (cost / total * 100) : 0;
-      rows += '<tr class="tc-row">'
+      return '<tr class="tc-row">'
         + '<td class="tc-tool">' + escHtml(t.tool_name) + '</td>'
         + '<td class="tc-calls" style="text-align:right;font-variant-numeric:tabular-nums;">' + (t.call_count || 0).toLocaleString() + '</td>'
         + '<td class="tc-cost" style="text-align:right;font-variant-numeric:tabular-nums;">$' + cost.toFixed(4) + '</td>'
@@ -401,7 +489,7 @@ JS: str = """\
       + '<table class="tc-table">'
       + '<thead><tr><th>Tool</th><th style="text-align:right">Calls</th>'
       + '<th style="text-align:right">Cost</th><th>Share</th></tr></thead>'
-      + '<tbody>' + rows + '</tbody>'
+      + '<tbody>' + rows.join('') + '</tbody>'
       + '</table></div></details>';
   }
 
@@ -461,56 +549,58 @@ JS: str = """\
       + '<div class="criteria-group-progress"><div class="criteria-group-progress-fill" style="width:' + pct + '%"></div></div>';
   }
 
-  function buildGroup(groupKey, labelHtml, items, repoUrl, taskData) {
-    var done = 0, total = items.length, cost = 0;
-    items.forEach(function(cr) {
-      if (cr.is_completed) done++;
-      cost += cr.cost_dollars || 0;
-    });
-    var allDone = done === total ? ' criteria-group-all-done' : '';
-    var html = '<div class="criteria-type-group' + allDone + '" data-group-type="' + escHtml(groupKey) + '">';
-    html += renderGroupHeader(groupKey, labelHtml, done, total, cost);
-    html += '<div class="criteria-group-items">';
-    items.forEach(function(cr) { html += renderCriterionItem(cr, repoUrl, taskData); });
-    html += '</div></div>';
-    return html;
+  function buildGroup(group, labelHtml, repoUrl, taskData) {
+    var total = group.items.length;
+    var allDone = group.done === total ? ' criteria-group-all-done' : '';
+    var parts = [
+      '<div class="criteria-type-group' + allDone + '" data-group-type="' + escHtml(group.key) + '">',
+      renderGroupHeader(group.key, labelHtml, group.done, total, group.cost),
+      '<div class="criteria-group-items">'
+    ];
+    group.items.forEach(function(cr) { parts.push(renderCriterionItem(cr, repoUrl, taskData)); });
+    parts.push('</div></div>');
+    return parts.join('');
   }
 
   function renderByCommit(taskData) {
     var criteria = taskData.criteria;
     var repoUrl = taskData.repo_url || '';
+    // One pass: bucket by commit and accumulate done/cost/timestamp per bucket
     var groups = {};
-    var timestamps = {};
+    var order = [];
+    var uncommitted = null;
     criteria.forEach(function(cr) {
       var h = cr.commit_hash || null;
       var key = h || '__uncommitted__';
-      if (!groups[key]) groups[key] = [];
-      groups[key].push(cr);
-      if (h && cr.committed_at && !timestamps[key]) timestamps[key] = cr.committed_at;
+      var g = groups[key];
+      if (!g) {
+        g = groups[key] = { key: key, items: [], done: 0, cost: 0, ts: '' };
+        if (h) order.push(g); else uncommitted = g;
+      }
+      g.items.push(cr);
+      if (cr.is_completed) g.done++;
+      g.cost += cr.cost_dollars || 0;
+      if (h && cr.committed_at && !g.ts) g.ts = cr.committed_at;
     });
-    var committed = Object.keys(groups).filter(function(k) { return k !== '__uncommitted__'; });
-    committed.sort(function(a, b) { return (timestamps[b] || '').localeCompare(timestamps[a] || ''); });
-    var order = committed.slice();
-    if (groups['__uncommitted__']) order.push('__uncommitted__');
+    order.sort(function(a, b) { return b.ts.localeCompare(a.ts); });
+    if (uncommitted) order.push(uncommitted);
 
-    var html = '';
-    order.forEach(function(key) {
+    return order.map(function(g) {
       var labelHtml;
-      if (key === '__uncommitted__') {
+      if (g === uncommitted) {
         labelHtml = '<span class="criteria-group-name">Uncommitted</span>';
       } else {
-        var short = escHtml(key.substring(0, 8));
-        var ts = fmtDate(timestamps[key] || '');
+        var short = escHtml(g.key.substring(0, 8));
+        var ts = fmtDate(g.ts);
         if (repoUrl) {
-          labelHtml = '<a href="' + repoUrl + '/commit/' + escHtml(key) + '" class="criteria-group-commit-link" target="_blank">' + short + '</a>';
+          labelHtml = '<a href="' + repoUrl + '/commit/' + escHtml(g.key) + '" class="criteria-group-commit-link" target="_blank">' + short + '</a>';
         } else {
           labelHtml = '<span class="criteria-group-commit-hash">' + short + '</span>';
         }
         if (ts) labelHtml += ' <span class="criteria-group-time">' + ts + '</span>';
       }
-      html += buildGroup(key, labelHtml, groups[key], repoUrl, taskData);
-    });
-    return html;
+      return buildGroup(g, labelHtml, repoUrl, taskData);
+    }).join('');
   }
 
   function renderCriteria(detail) {
@@ -518,6 +608,7 @@ JS: str = """\
     var taskData = CDATA[tid];
     if (!taskData) return;
     var target = detail.querySelector('.criteria-render-target');
+    escMemo = Object.create(null);
     target.innerHTML = renderByCommit(taskData);
     // Re-apply sort if active
     var activeSort = detail.querySelector('.criteria-sort-btn.sort-asc, .criteria-sort-btn.sort-desc');
@@ -527,22 +618,47 @@ JS: str = """\
     }
   }
 
+  // Criterion items of each rendered container, with their sort attributes
+  // parsed onto item._sortKeys. Filled on the first sort of a container;
+  // rendered criteria are never re-rendered, so the lists stay valid.
+  var criteriaItemsCache = new WeakMap();
+  function criteriaItems(container) {
+    var items = criteriaItemsCache.get(container);
+    if (!items) {
+      items = [];
+      for (var c = container.firstElementChild; c; c = c.nextElementSibling) {
+        if (c.classList.contains('criterion-item')) items.push(c);
+      }
+      items.forEach(function(item) {
+        item._sortKeys = {
+          cid: parseInt(item.getAttribute('data-cid')),
+          completed: item.getAttribute('data-sort-completed') || '',
+          cost: parseFloat(item.getAttribute('data-sort-cost')) || 0,
+          commit: item.getAttribute('data-sort-commit') || ''
+        };
+      });
+      criteriaItemsCache.set(container, items);
+    }
+    return items;
+  }
+
   function applyCriteriaSort(detail, sortKey, dir) {
     function sortItems(container) {
-      var items = Array.prototype.slice.call(container.querySelectorAll(':scope > .criterion-item'));
+      var items = criteriaItems(container);
       if (dir === 'none') {
-        items.sort(function(a, b) { return parseInt(a.getAttribute('data-cid')) - parseInt(b.getAttribute('data-cid')); });
+        items.sort(function(a, b) { return a._sortKeys.cid - b._sortKeys.cid; });
       } else {
-        var attrName = 'data-sort-' + sortKey;
         var isNumeric = (sortKey === 'cost');
         items.sort(function(a, b) {
-          var vA = a.getAttribute(attrName) || '';
-          var vB = b.getAttribute(attrName) || '';
-          var cmp = isNumeric ? ((parseFloat(vA) || 0) - (parseFloat(vB) || 0)) : vA.localeCompare(vB);
+          var vA = a._sortKeys[sortKey];
+          var vB = b._sortKeys[sortKey];
+          var cmp = isNumeric ? vA - vB : vA.localeCompare(vB);
           return dir === 'asc' ? cmp : -cmp;
         });
       }
-      items.forEach(function(item) { container.appendChild(item); });
+      var frag = document.createDocumentFragment();
+      items.forEach(function(item) { frag.appendChild(item); });
+      container.appendChild(frag);
     }
     detail.querySelectorAll('.criteria-group-items').forEach(function(gc) { sortItems(gc); });
     var flat = detail.querySelector('.criteria-render-target');
@@ -554,9 +670,11 @@ JS: str = """\
     var row = e.target.closest('tr.expandable');
     if (!row) return;
     var tid = row.getAttribute('data-task-id');
-    var detail = body.querySelector('tr.criteria-row[data-parent="' + tid + '"]');
+    var detail = criteriaRows[tid];
     if (!detail) return;
     var isExpanded = row.classList.toggle('expanded');
+    row._expanded = isExpanded;  // read by paginate() instead of classList
+    if (row.nextSibling !== detail) body.insertBefore(detail, row.nextSibling);
     detail.style.display = isExpanded ? '' : 'none';
     if (isExpanded && !criteriaRendered[tid]) {
       var cd = detail.querySelector('.criteria-detail');
@@ -566,42 +684,73 @@ JS: str = """\
   });
 
   // Criteria group header collapse/expand
-  document.addEventListener('click', function(e) {
-    var header = e.target.closest('.criteria-group-header');
-    if (!header) return;
-    e.stopPropagation();
+  function toggleCriteriaGroup(header) {
     var group = header.closest('.criteria-type-group');
     if (!group) return;
     group.classList.toggle('collapsed');
-  });
+  }
 
   // Criteria sort buttons
-  document.addEventListener('click', function(e) {
-    var btn = e.target.closest('.criteria-sort-btn');
-    if (!btn) return;
-    e.stopPropagation();
+  function handleCriteriaSortClick(btn) {
     var detail = btn.closest('.criteria-detail');
     if (!detail) return;
     var bar = btn.closest('.criteria-sort-bar');
+    // Reads first: sibling buttons, their arrows, and the current state
     var siblings = bar.querySelectorAll('.criteria-sort-btn');
+    var arrows = Array.prototype.map.call(siblings, function(s) {
+      return s.querySelector('.sort-arrow');
+    });
+    var btnArrow = btn.querySelector('.sort-arrow');
+    var sortKey = btn.getAttribute('data-sort-key');
     var wasAsc = btn.classList.contains('sort-asc');
     var wasDesc = btn.classList.contains('sort-desc');
 
-    siblings.forEach(function(s) {
-      s.classList.remove('sort-asc', 'sort-desc');
-      s.querySelector('.sort-arrow').textContent = '\u25B2';
-    });
-
     var dir;
     if (!wasAsc && !wasDesc) { dir = 'asc'; }
     else if (wasAsc) { dir = 'desc'; }
     else { dir = 'none'; }
 
+    // Then writes
+    for (var i = 0; i < siblings.length; i++) {
+      siblings[i].classList.remove('sort-asc', 'sort-desc');
+      arrows[i].textContent = '\u25B2';
+    }
     if (dir !== 'none') {
       btn.classList.add(dir === 'asc' ? 'sort-asc' : 'sort-desc');
-      btn.querySelector('.sort-arrow').textContent = dir === 'asc' ? '\u25B2' : '\u25BC';
+      btnArrow.textContent = dir === 'asc' ? '\u25B2' : '\u25BC';
+    }
+    applyCriteriaSort(detail, sortKey, dir);
+  }
+
+  // Dependency badge click-to-scroll
+  function followDepLink(link) {
+    var targetId = link.getAttribute('data-target');
+    var targetRow = document.querySelector('tr[data-task-id="' + targetId + '"]');
+    if (!targetRow) return;
+    if (targetRow.style.display === 'none') {
+      clearAllFilters();
+    }
+    targetRow.scrollIntoView({ behavior: 'smooth', block: 'center' });
+    targetRow.classList.add('dep-highlight');
+    setTimeout(function() { targetRow.classList.remove('dep-highlight'); }, 2000);
+  }
+
+  // One delegated listener for the page-wide click targets above; the
+  // targets never nest, so the first match handles the click.
+  document.addEventListener('click', function(e) {
+    var t = e.target;
+    var el;
+    if ((el = t.closest('.criteria-sort-btn'))) {
+      e.stopPropagation();
+      handleCriteriaSortClick(el);
+    } else if ((el = t.closest('.criteria-group-header'))) {
+      e.stopPropagation();
+      toggleCriteriaGroup(el);
+    } else if ((el = t.closest('.dep-link'))) {
+      e.preventDefault();
+      e.stopPropagation();
+      followDepLink(el);
     }
-    applyCriteriaSort(detail, btn.getAttribute('data-sort-key'), dir);
   });
 
   // Sort headers
@@ -614,32 +763,46 @@ JS: str = """\
         sortCol = col;
         sortAsc = true;
       }
-      headers.forEach(function(h) {
-        h.classList.remove('sort-asc', 'sort-desc');
-        h.querySelector('.sort-arrow').textContent = '\u25B2';
-      });
-      th.classList.add(sortAsc ? 'sort-asc' : 'sort-desc');
-      th.querySelector('.sort-arrow').textContent = sortAsc ? '\u25B2' : '\u25BC';
+      paintSortHeaders();
       applySort();
     });
   });
 
   // Status filter dropdown
+  // Filter-state changes from the controls coalesce into one filter pass on
+  // the next frame, however many of them land before it.
+  var filterFrame = 0;
+  function scheduleFilter() {
+    if (filterFrame) return;
+    filterFrame = requestAnimationFrame(function() {
+      filterFrame = 0;
+      applyFilter();
+    });
+  }
+
   statusSelect.addEventListener('change', function() {
     statusFilter = statusSelect.value;
-    applyFilter();
+    scheduleFilter();
   });
 
   // Dropdown filters
   complexitySelect.addEventListener('change', function() {
     complexityFilter = complexitySelect.value;
-    applyFilter();
+    scheduleFilter();
   });
 
-  // Search input
+  // Search input — debounced so filtering runs once the user pauses typing
+  // rather than on every keystroke. Dropdowns fire once per selection and are
+  // not debounced.
+  var SEARCH_DEBOUNCE_MS = 200;
+  var searchTimer = null;
   searchInput.addEventListener('input', function() {
-    searchTerm = searchInput.value.toLowerCase();
-    applyFilter();
+    if (searchTimer) clearTimeout(searchTimer);
+    searchTimer = setTimeout(function() {
+      searchTimer = null;
+      searchTerm = searchInput.value.toLowerCase();
+      scheduleFilter();
+    }, SEARCH_DEBOUNCE_MS);
   });
 
   // Clear all filters
@@ -648,23 +811,28 @@ JS: str = """\
   });
 
   // Page size
+  var pageSizeFrame = 0;
   pageSizeEl.addEventListener('change', function() {
-    pageSize = parseInt(pageSizeEl.value);
-    currentPage = 1;
-    pushHashState();
-    render();
+    if (pageSizeFrame) return;
+    pageSizeFrame = requestAnimationFrame(function() {
+      pageSizeFrame = 0;
+      pageSize = parseInt(pageSizeEl.value);
+      currentPage = 1;
+      pushHashState();
+      paginate();
+    });
   });
 
   // Prev/Next
   prevBtn.addEventListener('click', function() {
-    if (currentPage > 1) { currentPage--; pushHashState(); render(); }
+    if (currentPage > 1) { currentPage--; pushHashState(); paginate(); }
   });
   nextBtn.addEventListener('click', function() {
-    var maxP = Math.ceil(filtered.length / pageSize);
-    if (currentPage < maxP) { currentPage++; pushHashState(); render(); }
+    if (currentPage < maxPage) { currentPage++; pushHashState(); paginate(); }
   });
 
   // Restore state from URL hash, then initial render
+  suppressHash = true;
   var restored = restoreHashState();
   if (restored) {
     syncUIFromState();
@@ -672,6 +840,9 @@ JS: str = """\
   }
   applyFilter();
   applySort();
+  suppressHash = false;
+  // One write normalizes a restored hash (e.g. a page the filter reset)
+  if (restored) pushHashState();
 
   // Chart.js initialization (graceful fallback if CDN unavailable)
   var costTrendChart = null;
@@ -679,192 +850,166 @@ JS: str = """\
   var hourlyCostTaskChart = null;
   var hourlyCostSkillChart = null;
   var currentPeriod = 'weekly';
+  var periodLabels = { daily: 'Daily', weekly: 'Weekly', monthly: 'Monthly' };
 
-  function initCharts() {
-    if (typeof Chart === 'undefined') return;
-
+  // Theme colors for the charts, read from the CSS variables once and again
+  // only after a theme switch (getComputedStyle forces a style recalc).
+  var themeColors = null;
+  function readThemeColors() {
     var style = getComputedStyle(document.documentElement);
     function cssVar(name) { return style.getPropertyValue(name).trim(); }
-    var textMuted = cssVar('--text-muted') || '#94a3b8';
-    var border = cssVar('--border') || '#e2e8f0';
-    var periodLabels = { daily: 'Daily', weekly: 'Weekly', monthly: 'Monthly' };
+    return {
+      textMuted: cssVar('--text-muted') || '#94a3b8',
+      border: cssVar('--border') || '#e2e8f0',
+      bgPanel: cssVar('--bg-panel') || '#ffffff',
+      accent: cssVar('--accent') || '#3b82f6',
+      warning: cssVar('--warning') || '#f59e0b',
+      success: cssVar('--success') || '#22c55e'
+    };
+  }
 
-    // --- Task trend chart ---
-    if (window.__tuskCostTrend) {
-      var trendData = window.__tuskCostTrend;
-      var costTrendCanvas = document.getElementById('costTrendChart');
+  function destroyCharts() {
+    [costTrendChart, costSkillTrendChart, hourlyCostTaskChart, hourlyCostSkillChart].forEach(function(c) {
+      if (c) c.destroy();
+    });
+    costTrendChart = costSkillTrendChart = hourlyCostTaskChart = hourlyCostSkillChart = null;
+  }
 
-      if (costTrendChart) { costTrendChart.destroy(); costTrendChart = null; }
+  // Build the charts, or — when they already exist and only the period
+  // changed — swap the trend series in place and redraw without animation.
+  // `rebuild` (theme switch) re-reads the colors and recreates everything.
+  function initCharts(rebuild) {
+    if (typeof Chart === 'undefined') return;
 
-      var d = trendData[currentPeriod];
-      if (d && d.costs.length && costTrendCanvas) {
-        var accent = cssVar('--accent') || '#3b82f6';
-        var warning = cssVar('--warning') || '#f59e0b';
-        costTrendChart = new Chart(costTrendCanvas, {
-          type: 'bar',
-          data: {
-            labels: d.labels,
-            datasets: [
-              {
-                label: periodLabels[currentPeriod] + ' Cost (Tasks)',
-                data: d.costs,
-                backgroundColor: accent + 'B3',
-                borderColor: accent,
-                borderWidth: 1,
-                borderRadius: 2,
-                yAxisID: 'y',
-                order: 2
-              },
-              {
-                label: 'Cumulative (Tasks)',
-                data: d.cumulative,
-                type: 'line',
-                borderColor: warning,
-                backgroundColor: warning + '33',
-                pointBackgroundColor: warning,
-                pointBorderColor: cssVar('--bg-panel') || '#ffffff',
-                pointBorderWidth: 1.5,
-                pointRadius: 3.5,
-                borderWidth: 2.5,
-                fill: false,
-                tension: 0.1,
-                yAxisID: 'y1',
-                order: 1
+    if (rebuild) destroyCharts();
+    if (rebuild || !themeColors) themeColors = readThemeColors();
+    var colors = themeColors;
+    var textMuted = colors.textMuted;
+    var border = colors.border;
+
+    // Shared geometry for both cost-trend charts: only the series, colors,
+    // labels and decimal precision differ between the Tasks and Skills views.
+    function buildTrendChart(canvas, d, o) {
+      return new Chart(canvas, {
+        type: 'bar',
+        data: {
+          labels: d.labels,
+          datasets: [
+            {
+              label: periodLabels[currentPeriod] + ' Cost (' + o.source + ')',
+              data: d.costs,
+              backgroundColor: o.barColor + 'B3',
+              borderColor: o.barColor,
+              borderWidth: 1,
+              borderRadius: 2,
+              yAxisID: 'y',
+              order: 2
+            },
+            {
+              label: 'Cumulative (' + o.source + ')',
+              data: d.cumulative,
+              type: 'line',
+              borderColor: o.lineColor,
+              backgroundColor: o.lineColor + '33',
+              pointBackgroundColor: o.lineColor,
+              pointBorderColor: colors.bgPanel,
+              pointBorderWidth: 1.5,
+              pointRadius: 3.5,
+              borderWidth: 2.5,
+              fill: false,
+              tension: 0.1,
+              yAxisID: 'y1',
+              order: 1
+            }
+          ]
+        },
+        options: {
+          responsive: true,
+          maintainAspectRatio: false,
+          interaction: { mode: 'index', intersect: false },
+          plugins: {
+            tooltip: {
+              callbacks: {
+                label: function(ctx) {
+                  return ctx.dataset.label + ': ' + formatCost(ctx.parsed.y, o.tooltipDigits);
+                }
               }
-            ]
+            },
+            legend: { labels: { color: textMuted, usePointStyle: true, padding: 16 } }
           },
-          options: {
-            responsive: true,
-            maintainAspectRatio: false,
-            interaction: { mode: 'index', intersect: false },
-            plugins: {
-              tooltip: {
-                callbacks: {
-                  label: function(ctx) {
-                    return ctx.dataset.label + ': $' + ctx.parsed.y.toFixed(2).replace(/\\B(?=(\\d{3})+(?!\\d))/g, ',');
-                  }
-                }
-              },
-              legend: { labels: { color: textMuted, usePointStyle: true, padding: 16 } }
+          scales: {
+            x: {
+              ticks: { color: textMuted, maxRotation: 45, autoSkip: true, maxTicksLimit: 12, font: { size: 11 } },
+              grid: { display: false }
             },
-            scales: {
-              x: {
-                ticks: { color: textMuted, maxRotation: 45, autoSkip: true, maxTicksLimit: 12, font: { size: 11 } },
-                grid: { display: false }
+            y: {
+              position: 'left',
+              ticks: {
+                color: textMuted,
+                font: { size: 11 },
+                callback: function(v) { return formatCost(v, o.tickDigits); }
               },
-              y: {
-                position: 'left',
-                ticks: {
-                  color: textMuted,
-                  font: { size: 11 },
-                  callback: function(v) { return '$' + v.toFixed(0).replace(/\\B(?=(\\d{3})+(?!\\d))/g, ','); }
-                },
-                grid: { color: border, borderDash: [3, 3] }
+              grid: { color: border, borderDash: [3, 3] }
+            },
+            y1: {
+              position: 'right',
+              ticks: {
+                color: o.lineColor,
+                font: { size: 11 },
+                callback: function(v) { return formatCost(v, o.tickDigits); }
               },
-              y1: {
-                position: 'right',
-                ticks: {
-                  color: warning,
-                  font: { size: 11 },
-                  callback: function(v) { return '$' + v.toFixed(0).replace(/\\B(?=(\\d{3})+(?!\\d))/g, ','); }
-                },
-                grid: { drawOnChartArea: false }
-              }
+              grid: { drawOnChartArea: false }
             }
           }
-        });
+        }
+      });
+    }
+
+    // Point an existing trend chart at the current period's series, or build
+    // it; returns the live chart (null when there is nothing to plot).
+    function showTrend(chart, canvas, d, o) {
+      if (!(d && d.costs.length && canvas)) {
+        if (chart) chart.destroy();
+        return null;
       }
+      if (!chart) return buildTrendChart(canvas, d, o);
+      chart.data.labels = d.labels;
+      chart.data.datasets[0].label = periodLabels[currentPeriod] + ' Cost (' + o.source + ')';
+      chart.data.datasets[0].data = d.costs;
+      chart.data.datasets[1].data = d.cumulative;
+      chart.update('none');
+      return chart;
+    }
+
+    // --- Task trend chart ---
+    if (window.__tuskCostTrend) {
+      costTrendChart = showTrend(
+        costTrendChart, document.getElementById('costTrendChart'),
+        window.__tuskCostTrend[currentPeriod], {
+          source: 'Tasks',
+          barColor: colors.accent,
+          lineColor: colors.warning,
+          tooltipDigits: 2,
+          tickDigits: 0
+        });
     }
 
     // --- Skill trend chart ---
     if (window.__tuskSkillTrend) {
-      var skillTrendData = window.__tuskSkillTrend;
-      var skillTrendCanvas = document.getElementById('costSkillTrendChart');
-
-      if (costSkillTrendChart) { costSkillTrendChart.destroy(); costSkillTrendChart = null; }
-
-      var sd = skillTrendData[currentPeriod];
-      if (sd && sd.costs.length && skillTrendCanvas) {
-        var skillAccent = cssVar('--success') || '#22c55e';
-        var skillCum = '#8b5cf6';
-        costSkillTrendChart = new Chart(skillTrendCanvas, {
-          type: 'bar',
-          data: {
-            labels: sd.labels,
-            datasets: [
-              {
-                label: periodLabels[currentPeriod] + ' Cost (Skills)',
-                data: sd.costs,
-                backgroundColor: skillAccent + 'B3',
-                borderColor: skillAccent,
-                borderWidth: 1,
-                borderRadius: 2,
-                yAxisID: 'y',
-                order: 2
-              },
-              {
-                label: 'Cumulative (Skills)',
-                data: sd.cumulative,
-                type: 'line',
-                borderColor: skillCum,
-                backgroundColor: skillCum + '33',
-                pointBackgroundColor: skillCum,
-                pointBorderColor: cssVar('--bg-panel') || '#ffffff',
-                pointBorderWidth: 1.5,
-                pointRadius: 3.5,
-                borderWidth: 2.5,
-                fill: false,
-                tension: 0.1,
-                yAxisID: 'y1',
-                order: 1
-              }
-            ]
-          },
-          options: {
-            responsive: true,
-            maintainAspectRatio: false,
-            interaction: { mode: 'index', intersect: false },
-            plugins: {
-              tooltip: {
-                callbacks: {
-                  label: function(ctx) {
-                    return ctx.dataset.label + ': $' + ctx.parsed.y.toFixed(4).replace(/\\B(?=(\\d{3})+(?!\\d))/g, ',');
-                  }
-                }
-              },
-              legend: { labels: { color: textMuted, usePointStyle: true, padding: 16 } }
-            },
-            scales: {
-              x: {
-                ticks: { color: textMuted, maxRotation: 45, autoSkip: true, maxTicksLimit: 12, font: { size: 11 } },
-                grid: { display: false }
-              },
-              y: {
-                position: 'left',
-                ticks: {
-                  color: textMuted,
-                  font: { size: 11 },
-                  callback: function(v) { return '$' + v.toFixed(4).replace(/\\B(?=(\\d{3})+(?!\\d))/g, ','); }
-                },
-                grid: { color: border, borderDash: [3, 3] }
-              },
-              y1: {
-                position: 'right',
-                ticks: {
-                  color: skillCum,
-                  font: { size: 11 },
-                  callback: function(v) { return '$' + v.toFixed(4).replace(/\\B(?=(\\d{3})+(?!\\d))/g, ','); }
-                },
-                grid: { drawOnChartArea: false }
-              }
-            }
-          }
+      costSkillTrendChart = showTrend(
+        costSkillTrendChart, document.getElementById('costSkillTrendChart'),
+        window.__tuskSkillTrend[currentPeriod], {
+          source: 'Skills',
+          barColor: colors.success,
+          lineColor: '#8b5cf6',
+          tooltipDigits: 4,
+          tickDigits: 4
         });
-      }
     }
 
-    // --- Hourly cost charts ---
-    if (window.__tuskHourlyCost && window.__tuskHourlyCost.length === 24) {
+    // --- Hourly cost charts --- (period-independent: built once per theme)
+    if (window.__tuskHourlyCost && window.__tuskHourlyCost.length === 24
+        && !hourlyCostTaskChart && !hourlyCostSkillChart) {
       var rawHourly = window.__tuskHourlyCost;
       // Bucketing is done server-side (SQL applies utc_offset_minutes) so no JS shift needed.
       var hourLabels = [];
@@ -876,8 +1021,8 @@ JS: str = """\
         taskCosts.push(rawHourly[lh].cost_tasks);
         skillCosts.push(rawHourly[lh].cost_skills);
       }
-      var hAccent = cssVar('--accent') || '#3b82f6';
-      var hSkillAccent = cssVar('--success') || '#22c55e';
+      var hAccent = colors.accent;
+      var hSkillAccent = colors.success;
       var hourlyOpts = function() {
         return {
           responsive: true,
@@ -897,7 +1042,6 @@ JS: str = """\
       };
       var hourlyTaskCanvas = document.getElementById('hourlyCostTaskChart');
       if (hourlyTaskCanvas) {
-        if (hourlyCostTaskChart) { hourlyCostTaskChart.destroy(); hourlyCostTaskChart = null; }
         hourlyCostTaskChart = new Chart(hourlyTaskCanvas, {
           type: 'bar',
           data: { labels: hourLabels, datasets: [{ label: 'Task Cost', data: taskCosts, backgroundColor: hAccent + 'B3', borderColor: hAccent, borderWidth: 1, borderRadius: 2 }] },
@@ -906,7 +1050,6 @@ JS: str = """\
       }
       var hourlySkillCanvas = document.getElementById('hourlyCostSkillChart');
       if (hourlySkillCanvas) {
-        if (hourlyCostSkillChart) { hourlyCostSkillChart.destroy(); hourlyCostSkillChart = null; }
         hourlyCostSkillChart = new Chart(hourlySkillCanvas, {
           type: 'bar',
           data: { labels: hourLabels, datasets: [{ label: 'Skill Cost', data: skillCosts, backgroundColor: hSkillAccent + 'B3', borderColor: hSkillAccent, borderWidth: 1, borderRadius: 2 }] },
@@ -916,10 +1059,8 @@ JS: str = """\
     }
   }
 
-  initCharts();
-
   // --- Day-of-week / hour heatmap ---
-  (function() {
+  function renderDowHourHeatmap() {
     var container = document.getElementById('dowHourHeatmapContainer');
     if (!container) return;
     var raw = window.__tuskDowHourHeatmap;
@@ -993,7 +1134,27 @@ JS: str = """\
     }
 
     container.appendChild(wrap);
-  })();
+  }
+
+  // Cost tab charts and heatmap are built on first activation of the tab,
+  // not at page load (mirrors the DAG tab's render-on-first-switch). The
+  // build itself waits for idle time so the tab switch (or, when the URL
+  // restores the cost tab, the table's first paint) is not held up by
+  // Chart.js setup; the timeout bounds the wait on a busy main thread.
+  var costTabRendered = false;
+  function buildCostTab() {
+    initCharts();
+    renderDowHourHeatmap();
+  }
+  function renderCostTab() {
+    if (costTabRendered) return;
+    costTabRendered = true;
+    if (typeof requestIdleCallback === 'function') {
+      requestIdleCallback(buildCostTab, { timeout: 1500 });
+    } else {
+      setTimeout(buildCostTab, 0);
+    }
+  }
 
   var costTabs = document.querySelectorAll('#costTrendTabs .cost-tab');
   costTabs.forEach(function(tab) {
@@ -1016,27 +1177,10 @@ JS: str = """\
       html.setAttribute('data-theme', next);
       localStorage.setItem('tusk-theme', next);
       // Re-render charts with new theme colors
-      setTimeout(function() { initCharts(); }, 50);
+      if (costTabRendered) setTimeout(function() { initCharts(true); }, 50);
     });
   }
 
-  // Dependency badge click-to-scroll
-  document.addEventListener('click', function(e) {
-    var link = e.target.closest('.dep-link');
-    if (!link) return;
-    e.preventDefault();
-    e.stopPropagation();
-    var targetId = link.getAttribute('data-target');
-    var targetRow = document.querySelector('tr[data-task-id="' + targetId + '"]');
-    if (!targetRow) return;
-    if (targetRow.style.display === 'none') {
-      clearAllFilters();
-    }
-    targetRow.scrollIntoView({ behavior: 'smooth', block: 'center' });
-    targetRow.classList.add('dep-highlight');
-    setTimeout(function() { targetRow.classList.remove('dep-highlight'); }, 2000);
-  });
-
   // --- Tab navigation ---
   var tabBtns = document.querySelectorAll('#tabBar .tab-btn');
   var tabPanels = document.querySelectorAll('.tab-panel');
@@ -1053,6 +1197,7 @@ JS: str = """\
       window.__dagRendered = true;
       renderDag();
     }
+    if (tabId === 'cost') renderCostTab();
   }
 
   tabBtns.forEach(function(btn) {
@@ -5,18 +5,29 @@ Decomposes the dashboard into focused sub-functions with a CSS design system,
 KPI summary cards, and per-task metrics.
 
 Called by the tusk wrapper:
-    tusk dashboard
+    tusk dashboard [--force] [--external-assets] [--debug]
+
+The page is regenerated only when its inputs (database, WAL, config, VERSION
+or the dashboard modules) have changed since it was last written; --force
+regenerates unconditionally.
+
+By default the page is a single self-contained file. --external-assets writes
+the stylesheet and script as tusk-dashboard.css / tusk-dashboard.js beside it
+and links them instead, so the browser caches them across regenerations.
 
 Arguments received from tusk:
     sys.argv[1] — DB path
     sys.argv[2] — config path
 """
 
-import json
+import glob
+import hashlib
 import logging
 import os
+import re
 import sys
 import webbrowser
+from collections.abc import Iterator
 from datetime import datetime
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -37,6 +48,7 @@ except FileNotFoundError as _e:
 
 # Data-access layer
 get_connection = _data.get_connection
+fetch_has_tasks = _data.fetch_has_tasks
 fetch_task_metrics = _data.fetch_task_metrics
 fetch_kpi_data = _data.fetch_kpi_data
 fetch_all_criteria = _data.fetch_all_criteria
@@ -50,9 +62,7 @@ fetch_tool_call_stats_per_skill_run = _data.fetch_tool_call_stats_per_skill_run
 fetch_tool_call_stats_per_criterion = _data.fetch_tool_call_stats_per_criterion
 fetch_tool_call_events_per_criterion = _data.fetch_tool_call_events_per_criterion
 fetch_tool_call_stats_global = _data.fetch_tool_call_stats_global
-fetch_cost_trend = _data.fetch_cost_trend
-fetch_cost_trend_daily = _data.fetch_cost_trend_daily
-fetch_cost_trend_monthly = _data.fetch_cost_trend_monthly
+fetch_cost_trends = _data.fetch_cost_trends
 fetch_hourly_cost = _data.fetch_hourly_cost
 fetch_dow_hour_heatmap = _data.fetch_dow_hour_heatmap
 # HTML generation layer
@@ -69,7 +79,9 @@ generate_table_header = _html.generate_table_header
 generate_pagination = _html.generate_pagination
 generate_dag_section = _html.generate_dag_section
 generate_js = _html.generate_js
+write_assets = _html.write_assets
 generate_task_row = _html.generate_task_row
+script_json = _html.script_json
 
 
 def _tz_label(offset_minutes: int) -> str:
@@ -81,23 +93,30 @@ def _tz_label(offset_minutes: int) -> str:
     return f"UTC{sign}{h}"
 
 
-def generate_html(task_metrics: list[dict],
-                  cost_trend: list[dict] = None, all_criteria: dict[int, list[dict]] = None,
-                  cost_trend_daily: list[dict] = None, cost_trend_monthly: list[dict] = None,
-                  task_deps: dict[int, dict] = None,
-                  version: str = "",
-                  dag_tasks: list[dict] = None, dag_edges: list[dict] = None,
-                  dag_blockers: list[dict] = None, skill_runs: list[dict] = None,
-                  tool_call_per_task: list[dict] = None,
-                  tool_call_per_skill_run: list[dict] = None,
-                  tool_call_per_criterion: list[dict] = None,
-                  tool_call_global: list[dict] = None,
-                  tool_call_events_per_criterion: list[dict] = None,
-                  utc_offset_minutes: int = 0,
-                  hourly_cost: list[dict] = None,
-                  dow_hour_heatmap: list[dict] = None,
-                  project_name: str = "Tusk") -> str:
-    """Generate the full HTML dashboard by composing sub-functions."""
+def generate_html_stream(task_metrics: list[dict],
+                         cost_trend: list[dict] = None, all_criteria: dict[int, list[dict]] = None,
+                         cost_trend_daily: list[dict] = None, cost_trend_monthly: list[dict] = None,
+                         task_deps: dict[int, dict] = None,
+                         version: str = "",
+                         dag_tasks: list[dict] = None, dag_edges: list[dict] = None,
+                         dag_blockers: list[dict] = None, skill_runs: list[dict] = None,
+                         tool_call_per_task: list[dict] = None,
+                         tool_call_per_skill_run: list[dict] = None,
+                         tool_call_per_criterion: list[dict] = None,
+                         tool_call_global: list[dict] = None,
+                         tool_call_events_per_criterion: list[dict] = None,
+                         utc_offset_minutes: int = 0,
+                         hourly_cost: list[dict] = None,
+                         dow_hour_heatmap: list[dict] = None,
+                         project_name: str = "Tusk",
+                         external_assets: bool = False) -> Iterator[str]:
+    """Yield the HTML dashboard in fragments, composing sub-functions.
+
+    Task rows are rendered one at a time as they are consumed, so the table
+    body never exists as a single string when the output is written straight
+    to a file. With external_assets the CSS and JS are referenced by file name
+    (see write_assets()) rather than inlined.
+    """
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     tz_label = _tz_label(utc_offset_minutes)
 
@@ -130,31 +149,25 @@ def generate_html(task_metrics: list[dict],
         cid = r["criterion_id"]
         events_by_criterion.setdefault(cid, []).append(r)
 
-    # Build summary map for dependency tooltips
-    summary_map: dict[int, str] = {t["id"]: t["summary"] for t in task_metrics}
-
-    # Totals for table footer
-    total_sessions = sum(t.get("session_count") or 0 for t in task_metrics)
-    total_duration = sum(t.get("total_duration_seconds") or 0 for t in task_metrics)
-    total_lines_added = sum(t.get("total_lines_added") or 0 for t in task_metrics)
-    total_lines_removed = sum(t.get("total_lines_removed") or 0 for t in task_metrics)
-    total_tokens_in = sum(t["total_tokens_in"] for t in task_metrics)
-    total_tokens_out = sum(t["total_tokens_out"] for t in task_metrics)
-    total_cost = sum(t["total_cost"] for t in task_metrics)
+    # Build summary map for dependency tooltips (only read when a task has deps)
+    summary_map: dict[int, str] = (
+        {t["id"]: t["summary"] for t in task_metrics} if task_deps else {}
+    )
+
+    # Largest task cost, the scale for per-row cost heat classes
     max_cost = max((t["total_cost"] for t in task_metrics), default=0)
 
     # Task rows
     if task_metrics:
-        task_rows = ""
-        for t in task_metrics:
-            tid = t['id']
-            criteria_list = all_criteria.get(tid, [])
-            task_rows += generate_task_row(
-                t, criteria_list, task_deps, summary_map, max_cost,
-                tool_stats=tool_stats_by_task.get(tid)
+        task_rows = (
+            generate_task_row(
+                t, all_criteria.get(t['id'], []), task_deps, summary_map, max_cost,
+                tool_stats=tool_stats_by_task.get(t['id'])
             )
+            for t in task_metrics
+        )
     else:
-        task_rows = '<tr><td colspan="12" class="empty">No tasks found. Run <code>tusk init</code> and add some tasks.</td></tr>'
+        task_rows = ('<tr><td colspan="12" class="empty">No tasks found. Run <code>tusk init</code> and add some tasks.</td></tr>',)
 
     # Build criteria JSON for client-side rendering
     criteria_json: dict[int, dict] = {}
@@ -173,11 +186,12 @@ def generate_html(task_metrics: list[dict],
                 "task_tool_stats": tool_stats_by_task.get(tid, []),
                 "task_total_cost": t["total_cost"],
             }
-    _criteria_json_str = json.dumps(criteria_json).replace("</", "<\\/")
+    _criteria_json_str = script_json(criteria_json) if criteria_json else "{}"
     criteria_script = f'<script>window.CRITERIA_DATA = {_criteria_json_str};</script>'
 
-    hourly_cost_json = json.dumps(hourly_cost or []).replace("</", "<\\/")
-    dow_hour_heatmap_json = json.dumps(dow_hour_heatmap or []).replace("</", "<\\/")
+    # Empty payloads (fresh projects) skip the encoder entirely
+    hourly_cost_json = script_json(hourly_cost) if hourly_cost else "[]"
+    dow_hour_heatmap_json = script_json(dow_hour_heatmap) if dow_hour_heatmap else "[]"
 
     # All Runs table → Skills tab
     skill_runs_html = generate_skill_runs_section(skill_runs or [], tool_stats_by_run)
@@ -199,13 +213,13 @@ def generate_html(task_metrics: list[dict],
         dag_tasks or [], dag_edges or [], dag_blockers or []
     )
 
-    css = generate_css()
+    css = generate_css(external_assets)
     header = generate_header(now, tz_label, project_name)
     footer = generate_footer(now, version)
     filter_bar = generate_filter_bar()
     table_header = generate_table_header()
     pagination = generate_pagination()
-    js = generate_js()
+    js = generate_js(external_assets)
 
     # Inline script to set theme before first paint (prevents flash)
     theme_init = """\
@@ -222,7 +236,7 @@ def generate_html(task_metrics: list[dict],
 })();
 </script>"""
 
-    return f"""\
+    yield f"""\
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -242,7 +256,9 @@ def generate_html(task_metrics: list[dict],
   }});
 }})();
 </script>
-{css}
+"""
+    yield css
+    yield f"""
 </head>
 <body>
 
@@ -255,7 +271,9 @@ def generate_html(task_metrics: list[dict],
       <table id="metricsTable">
         {table_header}
         <tbody id="metricsBody">
-          {task_rows}
+          """
+    yield from task_rows
+    yield f"""
         </tbody>
       </table>
       {pagination}
@@ -283,22 +301,85 @@ def generate_html(task_metrics: list[dict],
 
 {footer}
 
-{criteria_script}
+"""
+    yield criteria_script
+    yield f"""
 <script>window.__tuskTzOffset = {utc_offset_minutes};</script>
 <script>window.__tuskHourlyCost = {hourly_cost_json};</script>
 <script>window.__tuskDowHourHeatmap = {dow_hour_heatmap_json};</script>
-{js}
+"""
+    yield js
+    yield """
 
 </body>
 </html>"""
 
 
+def generate_html(*args, **kwargs) -> str:
+    """Generate the full HTML dashboard as one string.
+
+    Takes the same arguments as generate_html_stream().
+    """
+    return "".join(generate_html_stream(*args, **kwargs))
+
+
+# Trailer written after </html> recording the inputs the page was built from
+_CACHE_KEY_RE = re.compile(rb"<!-- tusk-dashboard-key: ([0-9a-f]{40}) -->\s*$")
+
+
+def _dashboard_cache_key(
+    paths: list[str],
+    utc_offset_minutes: int,
+    external_assets: bool = False,
+    now: datetime | None = None,
+) -> str:
+    """Fingerprint the dashboard's inputs from file sizes and mtimes.
+
+    Missing and empty files contribute the same fixed marker: a WAL gaining
+    or losing frames changes the key, but the empty WAL that opening the
+    database creates does not. The current local hour is mixed in too, because the
+    page's generated timestamp and time-in-status columns age even when no
+    file changes.
+    """
+    now = now or datetime.now()
+    h = hashlib.sha1(f"offset={utc_offset_minutes};hour={now:%Y-%m-%d %H};".encode())
+    if external_assets:
+        h.update(b"external-assets;")
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        if st and st.st_size:
+            h.update(f"{path}:{st.st_mtime_ns}:{st.st_size};".encode())
+        else:
+            h.update(f"{path}:-;".encode())
+    return h.hexdigest()
+
+
+def _read_cache_key(output_path: str) -> str | None:
+    """Return the key stamped on an existing dashboard, or None.
+
+    A partially written file has no trailer and never matches.
+    """
+    try:
+        with open(output_path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - 128))
+            tail = f.read()
+    except OSError:
+        return None
+    m = _CACHE_KEY_RE.search(tail)
+    return m.group(1).decode("ascii") if m else None
+
+
 def main():
-    # Extract --debug before manual positional parsing
+    # Extract flags before manual positional parsing
     argv = sys.argv[1:]
     debug = "--debug" in argv
-    if debug:
-        argv = [a for a in argv if a != "--debug"]
+    force = "--force" in argv
+    external_assets = "--external-assets" in argv
+    argv = [a for a in argv if a not in ("--debug", "--force", "--external-assets")]
 
     logging.basicConfig(
         level=logging.DEBUG if debug else logging.WARNING,
@@ -307,7 +388,7 @@ def main():
     )
 
     if len(argv) < 2:
-        print("Usage: tusk dashboard [--debug]", file=sys.stderr)
+        print("Usage: tusk dashboard [--force] [--external-assets] [--debug]", file=sys.stderr)
         sys.exit(1)
 
     db_path = argv[0]
@@ -322,40 +403,10 @@ def main():
     utc_offset_minutes = int(datetime.now().astimezone().utcoffset().total_seconds() / 60)
     log.debug("UTC offset: %d minutes", utc_offset_minutes)
 
-    # Fetch data
-    conn = get_connection(db_path)
-    try:
-        task_metrics = fetch_task_metrics(conn)
-        cost_trend = fetch_cost_trend(conn, utc_offset_minutes)
-        cost_trend_daily = fetch_cost_trend_daily(conn, utc_offset_minutes)
-        cost_trend_monthly = fetch_cost_trend_monthly(conn, utc_offset_minutes)
-        all_criteria = fetch_all_criteria(conn)
-        task_deps = fetch_task_dependencies(conn)
-        # DAG data
-        dag_tasks = fetch_dag_tasks(conn)
-        dag_edges = fetch_edges(conn)
-        dag_blockers = fetch_blockers(conn)
-        # Skill run cost history
-        skill_runs = fetch_skill_runs(conn)
-        # Per-task tool call stats (for inline drilldown panels)
-        tool_call_per_task = fetch_tool_call_stats_per_task(conn)
-        # Per-skill-run tool call stats (for drilldown panels in skill-run table)
-        tool_call_per_skill_run = fetch_tool_call_stats_per_skill_run(conn)
-        # Per-criterion tool call stats (for inline drilldown inside each criterion entry)
-        tool_call_per_criterion = fetch_tool_call_stats_per_criterion(conn)
-        # Per-criterion individual tool call events (for timeline visualization)
-        tool_call_events_per_criterion = fetch_tool_call_events_per_criterion(conn)
-        # Project-wide tool call stats (for Skills tab aggregate view)
-        tool_call_global = fetch_tool_call_stats_global(conn)
-        # Hourly and day-of-week/hour cost aggregations
-        hourly_cost = fetch_hourly_cost(conn, utc_offset_minutes)
-        dow_hour_heatmap = fetch_dow_hour_heatmap(conn, utc_offset_minutes)
-    finally:
-        conn.close()
-
     # Read VERSION — check script dir first, then repo root (parent of DB dir)
     script_dir = os.path.dirname(os.path.abspath(__file__))
     version = ""
+    version_path = ""
     for candidate in [
         os.path.join(script_dir, "VERSION"),
         os.path.join(os.path.dirname(db_path), "..", "VERSION"),
@@ -363,15 +414,81 @@ def main():
         if os.path.isfile(candidate):
             with open(candidate) as vf:
                 version = vf.read().strip()
+            version_path = candidate
             break
     log.debug("Version: %s", version)
 
     # Derive project name for use in HTML header and output filename
     db_dir = os.path.dirname(db_path)
     project_name = os.path.basename(os.path.dirname(db_dir))
+    output_path = os.path.join(db_dir, f"{project_name}-dashboard.html")
+
+    # Skip regeneration when nothing the page is built from has changed
+    config_path = argv[1]
+    cache_inputs = [
+        db_path, db_path + "-wal", config_path, version_path,
+        *sorted(glob.glob(os.path.join(script_dir, "tusk-dashboard*.py"))),
+    ]
+    if external_assets:
+        # Assets depend only on the scripts, so refresh them up front; a
+        # deleted or edited asset file is restored without rebuilding the page
+        for asset_path in write_assets(db_dir):
+            log.debug("Wrote asset %s", asset_path)
+    # Keyed before any query runs, so a write landing mid-fetch leaves the
+    # trailer behind the database and the next run rebuilds the page
+    cache_key = _dashboard_cache_key(cache_inputs, utc_offset_minutes, external_assets)
+    if not force and _read_cache_key(output_path) == cache_key:
+        log.debug("Dashboard inputs unchanged (key %s)", cache_key)
+        print(f"Dashboard is up to date: {output_path}")
+        webbrowser.open(f"file://{os.path.abspath(output_path)}")
+        return
+
+    # Fetch data
+    conn = get_connection(db_path)
+    try:
+        if fetch_has_tasks(conn):
+            task_metrics = fetch_task_metrics(conn)
+            cost_trend_daily, cost_trend, cost_trend_monthly = fetch_cost_trends(
+                conn, utc_offset_minutes
+            )
+            all_criteria = fetch_all_criteria(conn)
+            task_deps = fetch_task_dependencies(conn)
+            # DAG data
+            dag_tasks = fetch_dag_tasks(conn)
+            dag_edges = fetch_edges(conn)
+            dag_blockers = fetch_blockers(conn)
+            # Per-task tool call stats (for inline drilldown panels)
+            tool_call_per_task = fetch_tool_call_stats_per_task(conn)
+            # Per-criterion tool call stats (for inline drilldown inside each criterion entry)
+            tool_call_per_criterion = fetch_tool_call_stats_per_criterion(conn)
+            # Per-criterion individual tool call events (for timeline visualization)
+            tool_call_events_per_criterion = fetch_tool_call_events_per_criterion(conn)
+            # Project-wide tool call stats (for Skills tab aggregate view)
+            tool_call_global = fetch_tool_call_stats_global(conn)
+            # Day-of-week/hour cost aggregation
+            dow_hour_heatmap = fetch_dow_hour_heatmap(conn, utc_offset_minutes)
+        else:
+            # Sessions, criteria, dependencies and blockers all hang off tasks,
+            # so a project without tasks skips straight to the skill-run data
+            log.debug("No tasks; skipping task-bound queries")
+            task_metrics, cost_trend_daily, cost_trend, cost_trend_monthly = [], [], [], []
+            all_criteria, task_deps = {}, {}
+            dag_tasks, dag_edges, dag_blockers = [], [], []
+            tool_call_per_task, tool_call_per_criterion = [], []
+            tool_call_events_per_criterion, tool_call_global = [], []
+            dow_hour_heatmap = []
+        # Skill run cost history
+        skill_runs = fetch_skill_runs(conn)
+        # Per-skill-run tool call stats (for drilldown panels in skill-run table)
+        tool_call_per_skill_run = fetch_tool_call_stats_per_skill_run(conn)
+        # Hourly cost aggregation (task sessions and skill runs)
+        hourly_cost = fetch_hourly_cost(conn, utc_offset_minutes)
+    finally:
+        conn.close()
 
-    # Generate HTML
-    html_content = generate_html(
+    # Generate HTML, streaming fragments through a large binary buffer so
+    # the page is never held in memory as one string
+    html_stream = generate_html_stream(
         task_metrics, cost_trend, all_criteria,
         cost_trend_daily, cost_trend_monthly, task_deps,
         version,
@@ -383,11 +500,14 @@ def main():
         hourly_cost=hourly_cost,
         dow_hour_heatmap=dow_hour_heatmap,
         project_name=project_name,
+        external_assets=external_assets,
     )
-    log.debug("Generated %d bytes of HTML", len(html_content))
-    output_path = os.path.join(db_dir, f"{project_name}-dashboard.html")
-    with open(output_path, "w") as f:
-        f.write(html_content)
+    html_size = 0
+    with open(output_path, "wb", buffering=1 << 20) as f:
+        for fragment in html_stream:
+            html_size += f.write(fragment.encode("utf-8"))
+        f.write(f"\n<!-- tusk-dashboard-key: {cache_key} -->\n".encode("ascii"))
+    log.debug("Generated %d bytes of HTML", html_size)
     log.debug("Wrote dashboard to %s", output_path)
 
     print(f"Dashboard written to {output_path}")
@@ -140,6 +140,44 @@ def similarity_cached(norm_a: str, norm_b: str) -> float:
     return combined_similarity(norm_a, norm_b)
 
 
+def scan_similar_pairs(norms: list[str], threshold: float) -> list[tuple[int, int, float]]:
+    """Return ``(i, j, score)`` for every pair ``i < j`` scoring >= *threshold*.
+
+    Produces the same scores as ``combined_similarity(norms[i], norms[j])``
+    while doing far less work per pair:
+
+    * token sets are built once per string rather than once per pair;
+    * one SequenceMatcher per ``j`` keeps ``norms[j]`` as its second
+      sequence, so its character index is built once and reused for every
+      ``i < j``;
+    * ``real_quick_ratio`` / ``quick_ratio`` are upper bounds on ``ratio``,
+      so a pair whose best possible blended score is below the threshold is
+      rejected before the full matching-blocks computation.
+
+    Pairs are returned ordered by ``(i, j)``.
+    """
+    token_sets = [tokenize(n) for n in norms]
+    found = []
+    matcher = SequenceMatcher(None)
+    for j in range(1, len(norms)):
+        matcher.set_seq2(norms[j])
+        tokens_b = token_sets[j]
+        for i in range(j):
+            tokens_a = token_sets[i]
+            union = len(tokens_a | tokens_b)
+            token_score = TOKEN_WEIGHT * (len(tokens_a & tokens_b) / union if union else 0.0)
+            matcher.set_seq1(norms[i])
+            if CHAR_WEIGHT * matcher.real_quick_ratio() + token_score < threshold:
+                continue
+            if CHAR_WEIGHT * matcher.quick_ratio() + token_score < threshold:
+                continue
+            score = CHAR_WEIGHT * matcher.ratio() + token_score
+            if score >= threshold:
+                found.append((i, j, score))
+    found.sort()
+    return found
+
+
 def get_open_tasks(
     conn: sqlite3.Connection,
     domain: str | None = None,
@@ -214,25 +252,19 @@ def cmd_scan(args: argparse.Namespace, db_path: str) -> int:
     finally:
         conn.close()
 
-    cache = build_norm_cache(tasks)
+    norms = [normalize_summary(t["summary"]) for t in tasks]
     log.debug("Comparing %d tasks (%d pairs)", len(tasks), len(tasks) * (len(tasks) - 1) // 2)
 
     pairs = []
-    seen = set()
-    for i, t1 in enumerate(tasks):
-        for t2 in tasks[i + 1 :]:
-            score = similarity_cached(cache[t1["id"]], cache[t2["id"]])
-            if score >= args.threshold:
-                key = (min(t1["id"], t2["id"]), max(t1["id"], t2["id"]))
-                if key not in seen:
-                    seen.add(key)
-                    pairs.append(
-                        {
-                            "task_a": {"id": t1["id"], "summary": t1["summary"]},
-                            "task_b": {"id": t2["id"], "summary": t2["summary"]},
-                            "similarity": round(score, 3),
-                        }
-                    )
+    for i, j, score in scan_similar_pairs(norms, args.threshold):
+        t1, t2 = tasks[i], tasks[j]
+        pairs.append(
+            {
+                "task_a": {"id": t1["id"], "summary": t1["summary"]},
+                "task_b": {"id": t2["id"], "summary": t2["summary"]},
+                "similarity": round(score, 3),
+            }
+        )
 
     pairs.sort(key=lambda p: p["similarity"], reverse=True)
 
@@ -1255,6 +1255,19 @@ def migrate_43(db_path: str, config_path: str, script_dir: str) -> None:
     print("  Migration 43: backfill normalize whitespace in convention topics")
 
 
+def migrate_44(db_path: str, config_path: str, script_dir: str) -> None:
+    run_script(db_path, """
+        BEGIN;
+        CREATE INDEX IF NOT EXISTS idx_task_sessions_task_id
+            ON task_sessions(task_id, cost_dollars, duration_seconds);
+        CREATE INDEX IF NOT EXISTS idx_task_sessions_started_at
+            ON task_sessions(started_at, cost_dollars);
+        PRAGMA user_version = 44;
+        COMMIT;
+    """)
+    print("  Migration 44: added task_sessions indexes on task_id and started_at")
+
+
 # ── Migration registry ────────────────────────────────────────────────────────
 
 MIGRATIONS = [
@@ -1301,6 +1314,7 @@ MIGRATIONS = [
     (41, migrate_41),
     (42, migrate_42),
     (43, migrate_43),
+    (44, migrate_44),
 ]
 
 
@@ -0,0 +1,94 @@
+"""Integration test for migrate_44: task_sessions indexes for dashboard aggregation.
+
+When migrate_44 runs against a DB at version 43 it must:
+  1. Create idx_task_sessions_task_id on (task_id, cost_dollars, duration_seconds).
+  2. Create idx_task_sessions_started_at on (started_at, cost_dollars).
+  3. Advance user_version to 44.
+  4. Be idempotent — running it twice produces no errors.
+"""
+
+import importlib.util
+import os
+import sqlite3
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SCRIPT_DIR = os.path.join(REPO_ROOT, "bin")
+
+
+def _load_migrate():
+    spec = importlib.util.spec_from_file_location(
+        "tusk_migrate",
+        os.path.join(SCRIPT_DIR, "tusk-migrate.py"),
+    )
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+tusk_migrate = _load_migrate()
+
+
+def _index_columns(db_path, index_name):
+    conn = sqlite3.connect(db_path)
+    try:
+        return [r[2] for r in conn.execute(f"PRAGMA index_info({index_name})")]
+    finally:
+        conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+@pytest.fixture()
+def db_at_v43(db_path):
+    """Return a fully-initialised DB rewound to version 43 without the new indexes."""
+    conn = sqlite3.connect(str(db_path))
+    conn.execute("DROP INDEX IF EXISTS idx_task_sessions_task_id")
+    conn.execute("DROP INDEX IF EXISTS idx_task_sessions_started_at")
+    conn.execute("PRAGMA user_version = 43")
+    conn.commit()
+    conn.close()
+    return str(db_path)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestMigrate44:
+
+    def test_task_id_index_created(self, db_at_v43, config_path):
+        tusk_migrate.migrate_44(db_at_v43, config_path, SCRIPT_DIR)
+
+        assert _index_columns(db_at_v43, "idx_task_sessions_task_id") == [
+            "task_id", "cost_dollars", "duration_seconds",
+        ]
+
+    def test_started_at_index_created(self, db_at_v43, config_path):
+        tusk_migrate.migrate_44(db_at_v43, config_path, SCRIPT_DIR)
+
+        assert _index_columns(db_at_v43, "idx_task_sessions_started_at") == [
+            "started_at", "cost_dollars",
+        ]
+
+    def test_schema_version_advanced_to_44(self, db_at_v43, config_path):
+        assert tusk_migrate.get_version(db_at_v43) == 43
+
+        tusk_migrate.migrate_44(db_at_v43, config_path, SCRIPT_DIR)
+
+        assert tusk_migrate.get_version(db_at_v43) == 44
+
+    def test_idempotent(self, db_at_v43, config_path):
+        tusk_migrate.migrate_44(db_at_v43, config_path, SCRIPT_DIR)
+        tusk_migrate.migrate_44(db_at_v43, config_path, SCRIPT_DIR)
+
+        assert tusk_migrate.get_version(db_at_v43) == 44
+
+    def test_fresh_init_already_has_indexes(self, db_path):
+        """tusk init creates both indexes and stamps version 44 directly."""
+        assert tusk_migrate.get_version(str(db_path)) == 44
+        assert _index_columns(str(db_path), "idx_task_sessions_task_id")
+        assert _index_columns(str(db_path), "idx_task_sessions_started_at")
@@ -0,0 +1,134 @@
+"""Unit tests for the tusk-dashboard.py regeneration cache key.
+
+Imports tusk-dashboard.py via importlib (hyphenated filename requires it) and
+exercises _dashboard_cache_key / _read_cache_key against temporary files,
+plus main() end to end against a fresh database.
+"""
+
+import importlib.util
+import os
+import sys
+from datetime import datetime
+from unittest.mock import patch
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _load_dashboard():
+    path = os.path.join(REPO_ROOT, "bin", "tusk-dashboard.py")
+    spec = importlib.util.spec_from_file_location("tusk_dashboard", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+dashboard = _load_dashboard()
+
+
+class TestDashboardCacheKey:
+    def test_stable_for_unchanged_inputs(self, tmp_path):
+        db = tmp_path / "tasks.db"
+        db.write_bytes(b"data")
+        paths = [str(db), str(db) + "-wal"]
+        assert dashboard._dashboard_cache_key(paths, 0) == dashboard._dashboard_cache_key(paths, 0)
+
+    def test_changes_when_input_is_rewritten(self, tmp_path):
+        db = tmp_path / "tasks.db"
+        db.write_bytes(b"data")
+        before = dashboard._dashboard_cache_key([str(db)], 0)
+        db.write_bytes(b"more data")
+        assert dashboard._dashboard_cache_key([str(db)], 0) != before
+
+    def test_changes_when_wal_appears(self, tmp_path):
+        db = tmp_path / "tasks.db"
+        db.write_bytes(b"data")
+        paths = [str(db), str(db) + "-wal"]
+        before = dashboard._dashboard_cache_key(paths, 0)
+        (tmp_path / "tasks.db-wal").write_bytes(b"wal")
+        assert dashboard._dashboard_cache_key(paths, 0) != before
+
+    def test_empty_wal_matches_missing_wal(self, tmp_path):
+        """Opening the database creates an empty WAL; that alone is not a change."""
+        db = tmp_path / "tasks.db"
+        db.write_bytes(b"data")
+        paths = [str(db), str(db) + "-wal"]
+        before = dashboard._dashboard_cache_key(paths, 0)
+        (tmp_path / "tasks.db-wal").write_bytes(b"")
+        assert dashboard._dashboard_cache_key(paths, 0) == before
+
+    def test_changes_with_utc_offset(self, tmp_path):
+        db = tmp_path / "tasks.db"
+        db.write_bytes(b"data")
+        assert dashboard._dashboard_cache_key([str(db)], 0) != dashboard._dashboard_cache_key([str(db)], 60)
+
+    def test_changes_with_external_assets(self, tmp_path):
+        db = tmp_path / "tasks.db"
+        db.write_bytes(b"data")
+        assert dashboard._dashboard_cache_key([str(db)], 0) != dashboard._dashboard_cache_key([str(db)], 0, True)
+
+    def test_stable_within_the_hour(self, tmp_path):
+        db = tmp_path / "tasks.db"
+        db.write_bytes(b"data")
+        early = datetime(2026, 1, 1, 10, 0, 5)
+        late = datetime(2026, 1, 1, 10, 59, 55)
+        assert dashboard._dashboard_cache_key([str(db)], 0, now=early) == dashboard._dashboard_cache_key([str(db)], 0, now=late)
+
+    def test_changes_with_the_hour(self, tmp_path):
+        """Time-in-status and the generated timestamp age without any file changing."""
+        db = tmp_path / "tasks.db"
+        db.write_bytes(b"data")
+        before = dashboard._dashboard_cache_key([str(db)], 0, now=datetime(2026, 1, 1, 10, 59))
+        after = dashboard._dashboard_cache_key([str(db)], 0, now=datetime(2026, 1, 1, 11, 0))
+        assert before != after
+
+
+class TestReadCacheKey:
+    def test_reads_trailer(self, tmp_path):
+        out = tmp_path / "p-dashboard.html"
+        key = "0123456789abcdef0123456789abcdef01234567"
+        out.write_bytes(b"<html>" + b"x" * 500 + b"</html>\n<!-- tusk-dashboard-key: " + key.encode() + b" -->\n")
+        assert dashboard._read_cache_key(str(out)) == key
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert dashboard._read_cache_key(str(tmp_path / "absent.html")) is None
+
+    def test_file_without_trailer_returns_none(self, tmp_path):
+        out = tmp_path / "p-dashboard.html"
+        out.write_bytes(b"<html>partial")
+        assert dashboard._read_cache_key(str(out)) is None
+
+
+def _run_main(db_path, config_path, *flags):
+    with patch.object(sys, "argv", ["tusk-dashboard.py", str(db_path), config_path, *flags]), \
+         patch.object(dashboard.webbrowser, "open"):
+        dashboard.main()
+
+
+class TestMainCaching:
+    def test_second_run_is_up_to_date(self, db_path, config_path, capsys):
+        _run_main(db_path, config_path)
+        assert "Dashboard written" in capsys.readouterr().out
+        _run_main(db_path, config_path)
+        assert "Dashboard is up to date" in capsys.readouterr().out
+
+    def test_write_during_fetch_forces_rebuild(self, db_path, config_path, capsys):
+        """A write landing after the key is taken must not be recorded as seen."""
+        real_get_connection = dashboard.get_connection
+
+        def get_connection_then_write(path):
+            conn = real_get_connection(path)
+            st = os.stat(db_path)
+            os.utime(db_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+            return conn
+
+        with patch.object(dashboard, "get_connection", side_effect=get_connection_then_write):
+            _run_main(db_path, config_path)
+        capsys.readouterr()
+        _run_main(db_path, config_path)
+        assert "Dashboard written" in capsys.readouterr().out
+
+    def test_external_assets_up_to_date_on_second_run(self, db_path, config_path, capsys):
+        _run_main(db_path, config_path, "--external-assets")
+        capsys.readouterr()
+        _run_main(db_path, config_path, "--external-assets")
+        assert "Dashboard is up to date" in capsys.readouterr().out
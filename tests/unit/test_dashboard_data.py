@@ -1122,10 +1122,14 @@ class TestFetchCostTrendDaily:
 
 
 # ---------------------------------------------------------------------------
-# fetch_cost_trend_monthly()
+# fetch_cost_trends() monthly roll-up
 # ---------------------------------------------------------------------------
 
 
+def _monthly(conn, offset_minutes=0):
+    return dashboard_data.fetch_cost_trends(conn, offset_minutes)[2]
+
+
 class TestFetchCostTrendMonthly:
     def test_groups_by_month_and_sums(self):
         conn = _make_conn()
@@ -1144,7 +1148,7 @@ class TestFetchCostTrendMonthly:
         )
         conn.commit()
 
-        rows = dashboard_data.fetch_cost_trend_monthly(conn)
+        rows = _monthly(conn)
         by_month = {r["month"]: r for r in rows}
         assert set(by_month.keys()) == {"2026-01", "2026-02"}
         assert abs(by_month["2026-01"]["monthly_cost"] - 0.25) < 1e-9
@@ -1163,7 +1167,7 @@ class TestFetchCostTrendMonthly:
         )
         conn.commit()
 
-        rows = dashboard_data.fetch_cost_trend_monthly(conn)
+        rows = _monthly(conn)
         assert len(rows) == 2
         assert rows[0]["month"] < rows[1]["month"]
 
@@ -1176,12 +1180,12 @@ class TestFetchCostTrendMonthly:
         )
         conn.commit()
 
-        rows = dashboard_data.fetch_cost_trend_monthly(conn)
+        rows = _monthly(conn)
         assert rows == []
 
     def test_empty_database_returns_empty_list(self):
         conn = _make_conn()
-        rows = dashboard_data.fetch_cost_trend_monthly(conn)
+        rows = _monthly(conn)
         assert rows == []
 
     def test_offset_minutes_applied(self):
@@ -1195,13 +1199,75 @@ class TestFetchCostTrendMonthly:
         )
         conn.commit()
 
-        rows_utc = dashboard_data.fetch_cost_trend_monthly(conn, offset_minutes=0)
+        rows_utc = _monthly(conn, offset_minutes=0)
         assert rows_utc[0]["month"] == "2026-01"
 
-        rows_shifted = dashboard_data.fetch_cost_trend_monthly(conn, offset_minutes=120)
+        rows_shifted = _monthly(conn, offset_minutes=120)
         assert rows_shifted[0]["month"] == "2026-02"
 
 
+# ---------------------------------------------------------------------------
+# fetch_cost_trends()
+# ---------------------------------------------------------------------------
+
+
+class TestFetchCostTrends:
+    def _seed(self, conn):
+        conn.execute("INSERT INTO tasks (id, summary) VALUES (?, ?)", (1, "task"))
+        for started_at, cost in [
+            ("2026-01-04 10:00:00", 0.10),  # Sunday
+            ("2026-01-05 10:00:00", 0.20),  # Monday
+            ("2026-01-31 23:00:00", 0.12),
+            ("2026-02-02 08:00:00", 0.08),
+        ]:
+            conn.execute(
+                "INSERT INTO task_sessions (task_id, started_at, cost_dollars) VALUES (?, ?, ?)",
+                (1, started_at, cost),
+            )
+        conn.commit()
+
+    @pytest.mark.parametrize("offset, expected_daily, expected_weekly, expected_monthly", [
+        (
+            0,
+            [("2026-01-04", 0.10), ("2026-01-05", 0.20), ("2026-01-31", 0.12), ("2026-02-02", 0.08)],
+            [("2025-12-29", 0.10), ("2026-01-05", 0.20), ("2026-01-26", 0.12), ("2026-02-02", 0.08)],
+            [("2026-01", 0.42), ("2026-02", 0.08)],
+        ),
+        (
+            # Saturday 23:00 UTC lands on Sunday Feb 1: same week, next month
+            120,
+            [("2026-01-04", 0.10), ("2026-01-05", 0.20), ("2026-02-01", 0.12), ("2026-02-02", 0.08)],
+            [("2025-12-29", 0.10), ("2026-01-05", 0.20), ("2026-01-26", 0.12), ("2026-02-02", 0.08)],
+            [("2026-01", 0.30), ("2026-02", 0.20)],
+        ),
+        (
+            # Both Monday sessions fall back to Sunday and join the previous week
+            -660,
+            [("2026-01-03", 0.10), ("2026-01-04", 0.20), ("2026-01-31", 0.12), ("2026-02-01", 0.08)],
+            [("2025-12-29", 0.30), ("2026-01-26", 0.20)],
+            [("2026-01", 0.42), ("2026-02", 0.08)],
+        ),
+    ])
+    def test_buckets_by_local_day_week_and_month(
+        self, offset, expected_daily, expected_weekly, expected_monthly
+    ):
+        conn = _make_conn()
+        self._seed(conn)
+        daily, weekly, monthly = dashboard_data.fetch_cost_trends(conn, offset)
+        for rows, key, cost_key, expected in [
+            (daily, "day", "daily_cost", expected_daily),
+            (weekly, "week_start", "weekly_cost", expected_weekly),
+            (monthly, "month", "monthly_cost", expected_monthly),
+        ]:
+            assert [r[key] for r in rows] == [e[0] for e in expected]
+            for got, (_, cost) in zip(rows, expected):
+                assert abs(got[cost_key] - cost) < 1e-9
+
+    def test_empty_database_returns_empty_lists(self):
+        conn = _make_conn()
+        assert dashboard_data.fetch_cost_trends(conn) == ([], [], [])
+
+
 # ---------------------------------------------------------------------------
 # Schema sync guard: _SCHEMA fixture vs bin/tusk CREATE TABLE task_sessions
 # ---------------------------------------------------------------------------
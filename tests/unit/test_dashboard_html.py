@@ -0,0 +1,106 @@
+"""Unit tests for tusk-dashboard-html.py formatting helpers.
+
+Imports tusk-dashboard-html.py via importlib (hyphenated filename requires it)
+and checks _parse_dt against the strptime-only behaviour it must preserve, and
+the line-based CSS/JS minifiers against the real dashboard stylesheet and script.
+"""
+
+import importlib.util
+import os
+import shutil
+import subprocess
+from datetime import datetime, timezone
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _load_dashboard_html():
+    path = os.path.join(REPO_ROOT, "bin", "tusk-dashboard-html.py")
+    spec = importlib.util.spec_from_file_location("tusk_dashboard_html", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+dashboard_html = _load_dashboard_html()
+_css_source = dashboard_html.tusk_loader.load("tusk-dashboard-css").CSS
+_js_source = dashboard_html.tusk_loader.load("tusk-dashboard-js").JS
+
+
+class TestParseDt:
+    @pytest.mark.parametrize("dt_str, expected", [
+        ("2024-01-01 10:00:00", datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)),
+        ("2024-01-01 10:00:00.123", datetime(2024, 1, 1, 10, 0, 0, 123000, tzinfo=timezone.utc)),
+        ("2024-01-01 10:00:00.5", datetime(2024, 1, 1, 10, 0, 0, 500000, tzinfo=timezone.utc)),
+        ("2024-01-01 10:00:00.123456", datetime(2024, 1, 1, 10, 0, 0, 123456, tzinfo=timezone.utc)),
+    ])
+    def test_sqlite_timestamps_parse_as_utc(self, dt_str, expected):
+        assert dashboard_html._parse_dt(dt_str) == expected
+
+    @pytest.mark.parametrize("dt_str", [
+        "2024-01-01 10:00:00.123+05:00",
+        "2024-01-01 10:00:00+05:00",
+        "2024-01-01 10:00:00.123Z",
+        "2024-01-01 10:00:00Z",
+        "2024-01-01 10:00:00.1234567",
+        "2024-01-01T10:00:00",
+        "2024-01-01",
+        "not a date",
+    ])
+    def test_other_forms_are_rejected(self, dt_str):
+        assert dashboard_html._parse_dt(dt_str) is None
+
+    @pytest.mark.parametrize("dt_str", ["", None])
+    def test_empty_returns_none(self, dt_str):
+        assert dashboard_html._parse_dt(dt_str) is None
+
+
+def _assert_no_layout_whitespace(text):
+    lines = text.splitlines()
+    assert lines
+    assert all(line and line == line.strip() for line in lines)
+
+
+class TestMinifyCss:
+    def test_strips_comments_indentation_and_blank_lines(self):
+        css = "/* header */\nbody {\n\n  color: red; /* inline */\n}\n/* multi\n   line */\n"
+        assert dashboard_html.minify_css(css) == "body {\ncolor: red;\n}"
+
+    def test_real_stylesheet(self):
+        out = dashboard_html.dashboard_css()
+        assert "/*" not in out and "*/" not in out
+        _assert_no_layout_whitespace(out)
+        code = dashboard_html._CSS_COMMENT_RE.sub("", _css_source)
+        for token in ("{", "}", ";", ":"):
+            assert out.count(token) == code.count(token), token
+
+
+class TestMinifyJs:
+    def test_strips_comment_lines_indentation_and_blank_lines(self):
+        js = "// header\nfunction f() {\n\n    // body\n    return 'a // b'; // trailing\n}\n"
+        assert dashboard_html.minify_js(js) == "function f() {\nreturn 'a // b'; // trailing\n}"
+
+    def test_real_script_keeps_every_code_line(self):
+        out = dashboard_html.dashboard_js()
+        _assert_no_layout_whitespace(out)
+        assert not any(line.startswith("//") for line in out.splitlines())
+        code_lines = [
+            line.strip() for line in _js_source.splitlines()
+            if line.strip() and not line.strip().startswith("//")
+        ]
+        assert out.splitlines() == code_lines
+
+    def test_real_script_has_no_template_literals(self):
+        """minify_js strips leading whitespace from every line, which would alter
+        a multi-line template literal; keep backticks out of the dashboard JS
+        (outside whole-line // comments)."""
+        assert "`" not in dashboard_html.dashboard_js()
+
+    @pytest.mark.skipif(shutil.which("node") is None, reason="node not installed")
+    def test_minified_script_parses(self, tmp_path):
+        script = tmp_path / "dashboard.js"
+        script.write_text(dashboard_html.dashboard_js(), encoding="utf-8")
+        result = subprocess.run(["node", "--check", str(script)], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
@@ -1,7 +1,7 @@
 """Unit tests for tusk-dupes.py similarity functions.
 
 Covers normalize_summary, tokenize, char_similarity, token_similarity,
-and combined_similarity, including threshold boundary cases.
+combined_similarity and scan_similar_pairs, including threshold boundary cases.
 """
 
 import importlib.util
@@ -206,3 +206,37 @@ class TestSimilarity:
             "add unit tests for similarity module",
         )
         assert score >= dupes.DEFAULT_CHECK_THRESHOLD
+
+
+# ── scan_similar_pairs ────────────────────────────────────────────────
+
+
+class TestScanSimilarPairs:
+    NORMS = [
+        "add unit tests for the similarity module",
+        "add unit tests for similarity module",
+        "initialise database schema migration tables",
+        "fix bug in tusk",
+        "fix issue in tusk",
+        "",
+        "",
+    ]
+
+    @pytest.mark.parametrize("threshold", [0.0, 0.3, 0.6, 0.82, 1.0])
+    def test_matches_pairwise_combined_similarity(self, threshold):
+        expected = [
+            (i, j, dupes.combined_similarity(a, b))
+            for j, b in enumerate(self.NORMS)
+            for i, a in enumerate(self.NORMS[:j])
+            if dupes.combined_similarity(a, b) >= threshold
+        ]
+        assert dupes.scan_similar_pairs(self.NORMS, threshold) == sorted(expected)
+
+    def test_pairs_ordered_by_index(self):
+        pairs = dupes.scan_similar_pairs(self.NORMS, 0.0)
+        assert [(i, j) for i, j, _ in pairs] == sorted((i, j) for i, j, _ in pairs)
+        assert all(i < j for i, j, _ in pairs)
+
+    def test_empty_and_single_inputs(self):
+        assert dupes.scan_similar_pairs([], 0.5) == []
+        assert dupes.scan_similar_pairs(["only one"], 0.0) == []